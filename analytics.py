@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+# ------------------------------------------------------------
+# Vectorized analytics primitives shared by the pages
+# ------------------------------------------------------------
+
+
+def parse_season_count(duration):
+    """Number of seasons from a duration like '3 Seasons' (<NA> for movies / missing)."""
+    seasons = duration.astype("string").str.extract(r'(\d+)\s*Season', expand=False)
+    return pd.to_numeric(seasons, errors='coerce').astype("Int32")
+
+
+def active_seasons_per_year(release_year, n_seasons, years=None):
+    """Per-year count of active TV seasons.
+
+    A show released in year ``y`` with ``n`` seasons counts once in each of
+    ``y .. y + n - 1``. Computed with a difference array: +1 at the first
+    year, -1 after the last, then a cumulative sum, so the cost is
+    O(shows + years) instead of O(shows x seasons).
+
+    ``years`` is the output range (defaults to the span of ``release_year``);
+    seasons falling outside it are not counted.
+    """
+    start = pd.to_numeric(pd.Series(release_year), errors='coerce').astype(float).to_numpy()
+    length = pd.to_numeric(pd.Series(n_seasons), errors='coerce').astype(float).to_numpy()
+    valid = ~np.isnan(start) & ~np.isnan(length) & (length > 0)
+    start = start[valid].astype(np.int64)
+    end = start + length[valid].astype(np.int64)  # exclusive
+
+    if years is None:
+        if len(start) == 0:
+            return pd.Series(dtype=np.int64)
+        years = range(int(start.min()), int(start.max()) + 1)
+    years = np.asarray(years, dtype=np.int64)
+    if len(years) == 0:
+        return pd.Series(dtype=np.int64)
+    lo, span = years.min(), years.max() - years.min() + 1
+
+    diff = np.zeros(span + 1, dtype=np.int64)
+    np.add.at(diff, np.clip(start - lo, 0, span), 1)
+    np.add.at(diff, np.clip(end - lo, 0, span), -1)
+    counts = np.cumsum(diff[:-1])
+
+    return pd.Series(counts[years - lo], index=years)
+
+
+def top_k_per_group(frame, group_cols, k, value_col='count'):
+    """The `k` rows with the largest `value_col` in each group.
+
+    Same rows as ``groupby(group_cols).apply(lambda g: g.nlargest(k, value_col))``
+    (groups sorted, values descending; ties always keep their original order),
+    but done with one stable sort and a cumcount rank instead of a Python call
+    per group.
+    """
+    group_cols = [group_cols] if isinstance(group_cols, str) else list(group_cols)
+    ordered = frame.sort_values(
+        group_cols + [value_col],
+        ascending=[True] * len(group_cols) + [False],
+        kind='stable',
+    )
+    rank = ordered.groupby(group_cols, sort=False, observed=True).cumcount().to_numpy()
+    return ordered[rank < k].reset_index(drop=True)
+
+
+def mode_per_group(frame, group_cols, value_col):
+    """Most frequent non-null `value_col` per group, with its share of the group's values.
+
+    Vectorized replacement for ``groupby(group_cols)[value_col].agg(lambda x: x.mode()[0])``:
+    values are factorized to sorted codes, counted per (group, code) and
+    unstacked into a group x code matrix whose row-wise argmax is the mode
+    (ties go to the smallest value, as with ``Series.mode()[0]``).
+    Returns the group columns, `value_col` and ``mode_share`` (0-1).
+    """
+    group_cols = [group_cols] if isinstance(group_cols, str) else list(group_cols)
+    codes, uniques = pd.factorize(frame[value_col], sort=True)
+    valid = codes >= 0
+
+    counts = (
+        frame.loc[valid, group_cols]
+        .assign(_code=codes[valid])
+        .groupby(group_cols + ['_code'], observed=True).size()
+        .unstack('_code', fill_value=0)
+    )
+    matrix = counts.to_numpy()
+    best = matrix.argmax(axis=1)
+
+    result = counts.index.to_frame(index=False)
+    result[value_col] = uniques[counts.columns.to_numpy()[best]]
+    result['mode_share'] = matrix[np.arange(len(matrix)), best] / matrix.sum(axis=1)
+    return result
+
+
+def cooccurrence_counts(group_codes, value_codes, n_groups, n_values):
+    """(n_groups x n_values) counts of aligned (group, value) code pairs.
+
+    One ``np.bincount`` over ``group * n_values + value``; replaces building a
+    rows x values dummy matrix and summing it per group. Negative (missing)
+    codes are ignored.
+    """
+    group_codes = np.asarray(group_codes, dtype=np.int64)
+    value_codes = np.asarray(value_codes, dtype=np.int64)
+    valid = (group_codes >= 0) & (value_codes >= 0)
+    flat = group_codes[valid] * n_values + value_codes[valid]
+    return np.bincount(flat, minlength=n_groups * n_values).reshape(n_groups, n_values)
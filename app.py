@@ -1,7 +1,13 @@
-import streamlit as st
 import pandas as pd
-import kagglehub
-import os
+import streamlit as st
+
+from warmup import warm_process
+
+# Copy-on-write for the whole process: every page derives frames from the
+# shared read-only catalog (filters, projections, .assign), and copy-on-write
+# lets those share memory with it until modified instead of copying eagerly.
+# Set here, once, before any page runs, so all pages see the same semantics.
+pd.set_option("mode.copy_on_write", True)
 
 st.markdown("""
 <style>
@@ -108,21 +114,12 @@ st.markdown("""
 # ------------------------------------------------------------
 # ✅ 2. Load dataset
 # ------------------------------------------------------------
-@st.cache_data
-def load_data():
-    try:
-        data_path = "netflix_titles.csv"
-        if not os.path.exists(data_path):
-            path = kagglehub.dataset_download("shivamb/netflix-shows")
-            data_path = f"{path}/netflix_titles.csv"
-        
-        return pd.read_csv(data_path)
-    except Exception as e:
-        st.error(f"Could not load dataset: {e}")
-        return pd.DataFrame({'show_id': [], 'title': [], 'type': []})
-
-df = load_data()
-st.session_state["netflix_df"] = df
+try:
+    # One process-wide, read-only catalog (with its cube and search indexes)
+    # shared by every session and page, built or mapped once per process
+    warm_process()
+except Exception as e:
+    st.error(f"Could not load dataset: {e}")
 
 
 # ------------------------------------------------------------
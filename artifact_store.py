@@ -0,0 +1,191 @@
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import shutil
+import uuid
+
+import pyarrow as pa
+
+# ------------------------------------------------------------
+# Persistent store of derived tables
+# ------------------------------------------------------------
+# Derived frames are written once as Arrow IPC files keyed by (dataset
+# fingerprint, stage name, code version, parameters), so a restarted or newly
+# spawned worker memory-maps them instead of recomputing. The code version
+# defaults to a hash of the file defining the stage plus the shared
+# derivation modules it builds on (DERIVATION_MODULES), so editing a stage or
+# anything it calls invalidates its artifacts.
+#
+# Artifacts live under <dir>/<stage>/<fingerprint>/<key>/, one Arrow file per
+# frame. An artifact is written into a private temp directory and renamed into
+# place in one step, so readers see either all of its parts or none, and the
+# first writer of a key wins. prune() drops every fingerprint but the current
+# one. The IPC read is memory-mapped and numeric
+# columns stay read-only views of the mapping; string and categorical
+# columns are materialized as pandas objects per process.
+#
+# Configuration (environment variables):
+#   NETFLIX_ARTIFACT_DIR  directory holding the artifacts (default ".artifacts")
+
+ARTIFACT_DIR_ENV = "NETFLIX_ARTIFACT_DIR"
+DEFAULT_ARTIFACT_DIR = ".artifacts"
+
+# Bumped when the on-disk layout changes
+STORE_FORMAT = 2
+
+# Shared modules whose code feeds the persisted stages
+DERIVATION_MODULES = ['analytics', 'catalog', 'cube', 'delta', 'snapshot']
+
+# Key stored in the schema metadata of part 0: number of frames in the artifact
+META_PARTS = b"netflix.parts"
+
+_CONVERSION_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError)
+
+
+def artifact_dir():
+    return os.environ.get(ARTIFACT_DIR_ENV, DEFAULT_ARTIFACT_DIR)
+
+
+def modules_version(modules=DERIVATION_MODULES, paths=()):
+    """Short sha256 over the source files of `modules` and of the extra `paths`."""
+    digest = hashlib.sha256()
+    for path in [importlib.util.find_spec(module).origin for module in modules] + list(paths):
+        with open(path, "rb") as fh:
+            digest.update(fh.read())
+    return digest.hexdigest()[:12]
+
+
+def source_version(func):
+    """Code version of a stage: the file defining it plus the shared derivation modules."""
+    try:
+        return modules_version(paths=[inspect.getsourcefile(func)])
+    except (OSError, TypeError):
+        # No source on disk: fall back to the compiled body
+        return hashlib.sha256(func.__code__.co_code + modules_version().encode()).hexdigest()[:12]
+
+
+def artifact_key(fingerprint, stage, code_version, params=None):
+    payload = json.dumps([STORE_FORMAT, fingerprint, stage, code_version, params or []], default=str)
+    return f"{fingerprint[:16]}/{hashlib.sha256(payload.encode()).hexdigest()[:32]}"
+
+
+def _artifact_path(stage, key):
+    return os.path.join(artifact_dir(), stage, key)
+
+
+def _part_file(directory, part):
+    return os.path.join(directory, f"part-{part}.arrow")
+
+
+def prune(fingerprint):
+    """Removes the artifacts of every dataset fingerprint other than `fingerprint`."""
+    root = artifact_dir()
+    if not os.path.isdir(root):
+        return
+    keep = fingerprint[:16]
+    for stage in os.listdir(root):
+        stage_dir = os.path.join(root, stage)
+        if not os.path.isdir(stage_dir):
+            continue
+        for name in os.listdir(stage_dir):
+            if name != keep:
+                # Workers still mapping these files keep them open until they let go
+                shutil.rmtree(os.path.join(stage_dir, name), ignore_errors=True)
+
+
+def _write_frame(frame, path, metadata=None):
+    table = pa.Table.from_pandas(frame)
+    if metadata:
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **metadata})
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _map_table(path):
+    # The mapping stays open as long as any column still references its buffers
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+def save(stage, key, frames):
+    """Writes `frames` (a sequence of DataFrames) as artifact `key` of `stage`.
+
+    All parts go to a private temp directory that is then renamed into place.
+    If another writer published the key first, its artifact is kept and ours
+    is discarded.
+    """
+    path = _artifact_path(stage, key)
+    tmp_dir = f"{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+    os.makedirs(tmp_dir)
+    try:
+        for part, frame in enumerate(frames):
+            metadata = {META_PARTS: str(len(frames)).encode()} if part == 0 else None
+            _write_frame(frame, _part_file(tmp_dir, part), metadata)
+        try:
+            os.rename(tmp_dir, path)
+        except OSError:
+            # Lost the race: a complete artifact is already in place
+            if not os.path.isdir(path):
+                raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def try_save(stage, key, frames):
+    """`save`, returning False instead of raising when the store is unwritable or Arrow cannot hold a frame."""
+    try:
+        save(stage, key, frames)
+    except (OSError, *_CONVERSION_ERRORS):
+        return False
+    return True
+
+
+def load_tables(stage, key):
+    """The memory-mapped Arrow tables of artifact `key` of `stage`, or None when absent."""
+    try:
+        path = _artifact_path(stage, key)
+        first = _map_table(_part_file(path, 0))
+        parts = int((first.schema.metadata or {}).get(META_PARTS, b"1"))
+        return [first] + [_map_table(_part_file(path, part)) for part in range(1, parts)]
+    except (OSError, ValueError, pa.ArrowInvalid):
+        return None
+
+
+def load(stage, key):
+    """The frames of artifact `key` of `stage`, or None when absent.
+
+    Numeric columns without nulls are zero-copy, read-only views of the
+    mapping; other columns are converted.
+    """
+    tables = load_tables(stage, key)
+    if tables is None:
+        return None
+    return [table.to_pandas(split_blocks=True) for table in tables]
+
+
+def persisted_stage(stage, code_version=None):
+    """Persists `func(catalog, *params)` in the artifact store, per catalog version.
+
+    `func` returns a DataFrame or a tuple of DataFrames. Results Arrow cannot
+    represent, and unwritable stores, fall back to plain computation.
+    """
+    def decorator(func):
+        version = code_version or source_version(func)
+
+        @functools.wraps(func)
+        def wrapper(catalog, *args, **kwargs):
+            key = artifact_key(catalog.version, stage, version, [args, sorted(kwargs.items())])
+            frames = load(stage, key)
+            if frames is not None:
+                return frames[0] if len(frames) == 1 else tuple(frames)
+
+            result = func(catalog, *args, **kwargs)
+            # Read-only store or a frame Arrow cannot hold: served without persisting
+            try_save(stage, key, result if isinstance(result, tuple) else (result,))
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,46 @@
+import os
+import uuid
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# ------------------------------------------------------------
+# Atomic file writes and stamped Parquet files
+# ------------------------------------------------------------
+# Derived files (the Parquet snapshot, the IMDb aggregates, the dataset
+# manifest) are shared by concurrent workers. Each is written to a private
+# temp file next to its destination and moved into place in one rename, so a
+# reader sees either the previous file or the complete new one, never a
+# partial write.
+#
+# A stamped Parquet file carries, in its schema metadata, the keys identifying
+# the source it was derived from; it is fresh while they still match.
+
+
+def replace_atomically(path, write):
+    """Calls `write(tmp_path)` and moves the written temp file onto `path` in one rename."""
+    tmp_path = f"{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def write_stamped_parquet(frame, path, stamp):
+    """Writes `frame` to `path` atomically, with the `stamp` keys added to its schema metadata."""
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **stamp})
+    replace_atomically(path, lambda tmp_path: pq.write_table(table, tmp_path))
+
+
+def has_stamp(path, stamp):
+    """Whether the Parquet file at `path` exists and carries every key of `stamp` unchanged."""
+    if not os.path.exists(path):
+        return False
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return False
+    return all(metadata.get(key) == value for key, value in stamp.items())
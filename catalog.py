@@ -0,0 +1,281 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import artifact_store
+import delta
+import resolver
+import snapshot
+from cube import AggregateCube
+from search_index import PostingIndex
+from typeahead import TypeaheadIndex
+
+# ------------------------------------------------------------
+# Catalog model: titles plus pre-exploded bridge tables
+# ------------------------------------------------------------
+# The comma-separated columns are split and exploded exactly once per dataset
+# version. Each bridge is a two-column frame keyed by the integer title_id
+# (the row position in `titles`) with the value stored as a categorical, so
+# pages join against it instead of re-running str.split().explode().
+#
+# One Catalog per dataset version is shared by every session in the process
+# and must be treated as read-only: pages never copy `titles` or add columns
+# to it. The app enables pandas copy-on-write for the process (see app.py),
+# so derived frames (filters, projections, .assign) share memory with the
+# catalog until they are actually modified.
+
+# bridge name -> source column in netflix_titles.csv
+BRIDGE_COLUMNS = {
+    "country": "country",
+    "genre": "listed_in",
+    "cast": "cast",
+    "director": "director",
+}
+
+# Bridges that also get a name -> title_id inverted index
+INDEXED_BRIDGES = ["cast", "director"]
+
+# Season codes by calendar quarter of date_added
+SEASON_ORDER = ['JFM', 'AMJ', 'JAS', 'OND']
+
+
+def build_bridge(values, name):
+    """Splits a comma-separated column into a (title_id, name) bridge table."""
+    exploded = values.dropna().astype(str).str.split(',').explode().str.strip()
+    exploded = exploded[exploded.notna() & (exploded != '')]
+
+    bridge = pd.DataFrame({
+        'title_id': exploded.index.to_numpy(dtype=np.int32),
+        name: pd.Categorical(exploded.to_numpy()),
+    })
+    # A title lists each value once, even if the source repeats it
+    return bridge.drop_duplicates(ignore_index=True)
+
+
+def build_date_dimension(titles):
+    """Date attributes of every title, indexed by title_id.
+
+    date_added is parsed once by the snapshot; everything pages derive from
+    it (year/month/quarter/season/day-of-week and the release -> add lag) is
+    computed here once per dataset version. Missing dates give <NA>.
+    """
+    date_added = pd.to_datetime(titles['date_added'], errors='coerce')
+    release_date = pd.to_datetime(titles['release_year'], format='%Y', errors='coerce')
+    quarter = date_added.dt.quarter
+
+    season_codes = (quarter - 1).fillna(-1).astype(np.int8).to_numpy()
+    return pd.DataFrame({
+        'date_added': date_added,
+        'year_added': date_added.dt.year.astype("Int16"),
+        'month': date_added.dt.month.astype("Int8"),
+        'quarter': quarter.astype("Int8"),
+        'season': pd.Categorical.from_codes(season_codes, categories=SEASON_ORDER),
+        'day_of_week': date_added.dt.dayofweek.astype("Int8"),
+        'lag_days': (date_added - release_date).dt.days.astype("Int32"),
+    }, index=titles.index)
+
+
+class Catalog:
+    """The Netflix titles and their bridge tables for one dataset version."""
+
+    def __init__(self, titles, version, bridges=None, dates=None):
+        self.titles = titles.reset_index(drop=True)
+        # Content fingerprint (sha256 of the source CSV); keys every per-version cache
+        self.version = version
+        # bridges / dates are passed in when a delta has already patched them
+        if bridges is None:
+            bridges = {
+                name: build_bridge(self.titles[column], name)
+                for name, column in BRIDGE_COLUMNS.items()
+                if column in self.titles.columns
+            }
+        self.bridges = bridges
+        self.indexes = {
+            name: PostingIndex(self.bridges[name], name)
+            for name in INDEXED_BRIDGES
+            if name in self.bridges
+        }
+        self._typeaheads = {}
+        self.dates = build_date_dimension(self.titles) if dates is None else dates
+        self._cube = None
+        # The TitleDelta this version was derived from (None for a full build)
+        self.delta = None
+
+    def bridge(self, name, rows=None):
+        """Bridge `name` as (title_id, value) pairs, optionally limited to the title_ids in `rows`."""
+        bridge = self.bridges[name]
+        if rows is not None:
+            bridge = bridge[bridge['title_id'].isin(rows.index)]
+        return bridge
+
+    def index(self, name):
+        """The inverted index (name -> sorted title_ids) of an indexed bridge."""
+        return self.indexes[name]
+
+    def typeahead(self, name):
+        """Typeahead search over the names of an indexed bridge, built on first use."""
+        if name not in self._typeaheads:
+            self._typeaheads[name] = TypeaheadIndex.from_postings(self.indexes[name])
+        return self._typeaheads[name]
+
+    def cube(self):
+        """The pre-aggregated count cube, built on first use (or carried over by a delta)."""
+        if self._cube is None:
+            self._cube = AggregateCube(self)
+        return self._cube
+
+    def titles_for(self, name, value):
+        """Rows of `titles` whose `name` bridge lists `value` exactly."""
+        return self.titles.iloc[self.indexes[name].lookup(value)]
+
+    def exploded(self, names, rows=None, columns=()):
+        """Titles exploded by one or more bridges, like chained str.split().explode().
+
+        `rows` is an optional subset of `titles` (indexed by title_id) and
+        `columns` are the title columns carried along. The result is indexed
+        by title_id, with one column per bridge holding plain string values.
+        """
+        names = [names] if isinstance(names, str) else list(names)
+
+        pairs = self._pairs(names[0], rows)
+        for name in names[1:]:
+            pairs = pairs.merge(self._pairs(name, rows), on='title_id')
+
+        source = self.titles if rows is None else rows
+        out = source.loc[pairs['title_id'].to_numpy(), list(columns)]
+        for name in names:
+            out[name] = pairs[name].to_numpy()
+        return out
+
+    def primary(self, name, rows=None):
+        """The first listed value of bridge `name` per title (e.g. the primary country)."""
+        firsts = self._pairs(name, rows).drop_duplicates('title_id')
+        return pd.Series(firsts[name].to_numpy(), index=firsts['title_id'].to_numpy(), name=name)
+
+    def _pairs(self, name, rows):
+        bridge = self.bridge(name, rows)
+        values = bridge[name].cat.categories.to_numpy(dtype=object).take(bridge[name].cat.codes.to_numpy())
+        return pd.DataFrame({'title_id': bridge['title_id'].to_numpy(), name: values})
+
+
+def apply_delta(catalog, titles, version):
+    """Derives the catalog for `titles` from `catalog` by patching only the changed rows.
+
+    Titles keep the refreshed file's row order (title_id = row position, as in
+    a full build), so unchanged bridge rows only need their title_id
+    renumbered. Returns None when the change set is too large (or not keyed)
+    and a full build is cheaper.
+    """
+    change = delta.diff_titles(catalog.titles, titles)
+    if change is None or not change.is_incremental(len(catalog.titles)):
+        return None
+
+    titles = titles.reset_index(drop=True)
+    renumber = change.renumbering(len(catalog.titles))
+    stale = change.stale_ids()
+    fresh = change.fresh_ids(renumber)
+
+    bridges = {
+        name: delta.patch_bridge(bridge, name, renumber, stale, build_bridge(titles.loc[fresh, BRIDGE_COLUMNS[name]], name))
+        for name, bridge in catalog.bridges.items()
+    }
+    unchanged = change.unchanged_ids()
+    dates = pd.concat([
+        catalog.dates.iloc[unchanged].set_axis(renumber[unchanged]),
+        build_date_dimension(titles.loc[fresh]),
+    ]).sort_index().reset_index(drop=True)  # every title_id is present: back to a RangeIndex, as in a full build
+
+    patched = Catalog(titles, version, bridges=bridges, dates=dates)
+    if catalog._cube is not None:
+        patched._cube = catalog._cube.with_delta(catalog, stale, patched, fresh)
+    patched.delta = change
+    return patched
+
+
+# ------------------------------------------------------------
+# Catalog shared by all worker processes
+# ------------------------------------------------------------
+# The first worker to build a dataset version publishes its titles, dates and
+# bridges to the artifact store; every other worker memory-maps them instead
+# of building its own. Bridge columns (title_id and category codes) are
+# zero-copy, read-only views of the mapped files, so those pages are shared
+# through the OS page cache. Text columns of `titles` are still materialized
+# per process as Python strings.
+#
+# Whichever build path produced it (full or delta), a published catalog has
+# the same layout: titles in CSV row order, bridges sorted by title_id. An
+# artifact is published in one rename, and the first publisher of a version
+# wins, so workers never map a mix of two builds.
+
+CATALOG_STAGE = 'catalog'
+
+# Bumped when the published layout changes
+CATALOG_LAYOUT = 2
+
+
+def _catalog_key(version):
+    code_version = artifact_store.modules_version(['catalog', 'delta', 'snapshot'])
+    return artifact_store.artifact_key(version, CATALOG_STAGE, [CATALOG_LAYOUT, code_version])
+
+
+def publish_catalog(catalog):
+    """Writes the catalog's tables to the artifact store. Returns False when they could not be written."""
+    frames = [catalog.titles, catalog.dates, *catalog.bridges.values()]
+    return artifact_store.try_save(CATALOG_STAGE, _catalog_key(catalog.version), frames)
+
+
+def _mapped_bridge(table):
+    """Zero-copy bridge frame over a memory-mapped (title_id, name) table."""
+    name = table.schema.names[1]
+    values = table.column(name).combine_chunks()
+    return pd.DataFrame({
+        'title_id': table.column('title_id').combine_chunks().to_numpy(zero_copy_only=True),
+        name: pd.Categorical.from_codes(
+            values.indices.to_numpy(zero_copy_only=True),
+            categories=pd.Index(values.dictionary.to_numpy(zero_copy_only=False)),
+        ),
+    }, copy=False)
+
+
+def open_published_catalog(version):
+    """The catalog published for `version`, memory-mapped, or None when there is none."""
+    tables = artifact_store.load_tables(CATALOG_STAGE, _catalog_key(version))
+    if tables is None:
+        return None
+    titles, dates, *bridges = tables
+    return Catalog(
+        titles.to_pandas(),
+        version,
+        bridges={table.schema.names[1]: _mapped_bridge(table) for table in bridges},
+        dates=dates.to_pandas(),
+    )
+
+
+# The most recent catalog built by this process; a refreshed CSV is ingested
+# as a delta against it instead of being re-exploded from scratch.
+_latest = {}
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _build_catalog(csv_path, version):
+    # Another worker may already have built this version
+    catalog = open_published_catalog(version)
+    if catalog is None:
+        titles = snapshot.load_catalog(csv_path)
+        previous = _latest.get("catalog")
+        if previous is not None and previous.version != version:
+            catalog = apply_delta(previous, titles, version)
+        if catalog is None:
+            catalog = Catalog(titles, version)
+        publish_catalog(catalog)
+    # Artifacts of earlier dataset versions are never read again
+    artifact_store.prune(version)
+
+    _latest["catalog"] = catalog
+    return catalog
+
+
+def get_catalog():
+    """The catalog for the current dataset version, built once per process and version."""
+    record = resolver.resolve()
+    return _build_catalog(record["path"], record["sha256"])
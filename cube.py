@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+
+# ------------------------------------------------------------
+# Pre-aggregated cube feeding the count / mean-lag charts
+# ------------------------------------------------------------
+# Title facts are aggregated once per dataset version into the cuboids listed
+# in CUBOIDS, each grouped by its own dimensions only. country and genre are
+# many-to-many, so a cuboid is tied to its bridge dimensions: a title is
+# counted once per country / genre it lists, exactly like the
+# explode-then-count code this replaces. Measures are additive (count, lag
+# sum, lag count), so a rollup sums the smallest cuboid covering its
+# dimensions, and a catalog delta is applied by adding the changed titles'
+# facts with a sign.
+#
+# The cuboids are chosen from what the pages query. The full-grain base
+# cuboid is barely smaller than the title count (release_year x year_added x
+# rating is close to unique per title), so it only serves release_year
+# rollups; everything else reads a coarser cuboid.
+
+BASE_DIMS = ['year_added', 'release_year', 'type', 'rating', 'season']
+BRIDGE_DIMS = ['country', 'genre']
+ALL_DIMS = BASE_DIMS + BRIDGE_DIMS
+MEASURES = ['count', 'lag_sum', 'lag_n']
+
+# (bridge dimensions, base dimensions) of each materialized cuboid
+CUBOIDS = [
+    ((), BASE_DIMS),
+    ((), ['year_added', 'type', 'season']),
+    (('country',), ['type', 'rating']),
+    (('genre',), ['year_added', 'season']),
+    (('country', 'genre'), ['rating']),
+]
+
+# Release -> add lags outside this window (in days) are treated as data errors
+LAG_WINDOW = (0, 5000)
+
+
+def title_facts(catalog, title_ids=None):
+    """One row per title (indexed by title_id): base dimensions plus additive measures."""
+    titles, dates = catalog.titles, catalog.dates
+    if title_ids is not None:
+        titles, dates = titles.loc[title_ids], dates.loc[title_ids]
+
+    lag = dates['lag_days']
+    in_window = lag.between(*LAG_WINDOW).fillna(False).astype(bool)
+    return pd.DataFrame({
+        'year_added': dates['year_added'],
+        'release_year': titles['release_year'],
+        'type': titles['type'].astype(object),
+        'rating': titles['rating'].astype(object),
+        'season': dates['season'].astype(object),
+        'count': np.ones(len(titles), dtype=np.int64),
+        'lag_sum': lag.where(in_window, 0).fillna(0).astype(np.int64),
+        'lag_n': in_window.astype(np.int64),
+    }, index=titles.index)
+
+
+def aggregate(facts, catalog, bridges, dims):
+    """Aggregates title facts, exploded by `bridges`, to the cells of `dims` x `bridges`."""
+    if bridges:
+        facts = catalog.exploded(list(bridges), rows=facts, columns=list(dims) + MEASURES)
+    return facts.groupby(list(dims) + list(bridges), dropna=False, sort=False)[MEASURES].sum().reset_index()
+
+
+def _cuboid_key(bridges, dims):
+    return frozenset(bridges), tuple(dims)
+
+
+class AggregateCube:
+    """Count and mean-lag rollups over year_added, release_year, type, rating, season, country and genre."""
+
+    def __init__(self, catalog=None, cuboids=None):
+        if cuboids is None:
+            facts = title_facts(catalog)
+            cuboids = {
+                _cuboid_key(bridges, dims): aggregate(facts, catalog, bridges, dims)
+                for bridges, dims in CUBOIDS
+            }
+        self.cuboids = cuboids
+
+    def with_delta(self, old_catalog, removed_ids, new_catalog, added_ids):
+        """A new cube without the facts of `removed_ids` (old catalog) and with those of `added_ids` (new catalog).
+
+        Only the changed titles are exploded and aggregated; the result is
+        merged into the existing cells.
+        """
+        removed = title_facts(old_catalog, removed_ids)
+        added = title_facts(new_catalog, added_ids)
+        cuboids = {}
+        for bridges, dims in CUBOIDS:
+            key = _cuboid_key(bridges, dims)
+            minus = aggregate(removed, old_catalog, bridges, dims)
+            minus[MEASURES] = -minus[MEASURES]
+            cells = pd.concat([self.cuboids[key], minus, aggregate(added, new_catalog, bridges, dims)], ignore_index=True)
+            cells = cells.groupby(list(dims) + list(bridges), dropna=False, sort=False)[MEASURES].sum().reset_index()
+            cuboids[key] = cells[cells['count'] > 0].reset_index(drop=True)
+        return AggregateCube(cuboids=cuboids)
+
+    def __len__(self):
+        return sum(len(cells) for cells in self.cuboids.values())
+
+    def rollup(self, dims, filters=None, measure='count'):
+        """Rolls the cube up to `dims`.
+
+        `filters` maps a dimension to a value, a list of values, or a
+        callable returning a boolean mask for that dimension's column.
+        `measure` is 'count' (titles, once per country / genre when those are
+        involved) or 'lag_days' (mean release -> add lag within LAG_WINDOW).
+        Returns a Series indexed by `dims` (or a scalar when `dims` is empty).
+        """
+        dims = [dims] if isinstance(dims, str) else list(dims)
+        filters = filters or {}
+        used = set(dims) | set(filters)
+        unknown = used - set(ALL_DIMS)
+        if unknown:
+            raise KeyError(f"Unknown cube dimension(s): {sorted(unknown)}")
+
+        cells = self._covering(used)
+        if filters:
+            mask = np.ones(len(cells), dtype=bool)
+            for dim, value in filters.items():
+                column = cells[dim]
+                if callable(value):
+                    matched = value(column)
+                elif pd.api.types.is_list_like(value):
+                    matched = column.isin(list(value))
+                else:
+                    matched = column == value
+                mask &= pd.Series(matched, index=cells.index).fillna(False).to_numpy(dtype=bool)
+            cells = cells[mask]
+
+        totals = cells.groupby(dims)[MEASURES].sum() if dims else cells[MEASURES].sum()
+        return _measure(totals, measure)
+
+
+    def _covering(self, used):
+        """Cells of the smallest cuboid with exactly the bridges in `used` and all its other dimensions."""
+        bridges = frozenset(used & set(BRIDGE_DIMS))
+        candidates = [
+            cells for (cuboid_bridges, dims), cells in self.cuboids.items()
+            if cuboid_bridges == bridges and used - bridges <= set(dims)
+        ]
+        if not candidates:
+            raise KeyError(f"No cuboid covers dimension(s): {sorted(used)}")
+        return min(candidates, key=len)
+
+
+def _measure(totals, measure):
+    if measure == 'count':
+        return totals['count']
+    if measure == 'lag_days':
+        if isinstance(totals, pd.Series):
+            return totals['lag_sum'] / totals['lag_n'] if totals['lag_n'] else np.nan
+        totals = totals[totals['lag_n'] > 0]
+        return (totals['lag_sum'] / totals['lag_n']).rename('lag_days')
+    raise KeyError(f"Unknown cube measure: {measure}")
+
+
+def get_cube(catalog):
+    """The aggregate cube of `catalog`, materialized once per dataset version."""
+    return catalog.cube()
@@ -0,0 +1,71 @@
+import functools
+import inspect
+
+from lru import BoundedLRU
+from singleflight import SingleFlight
+
+# ------------------------------------------------------------
+# Per-dataset-version memoization of catalog derivations
+# ------------------------------------------------------------
+# A Catalog carries its content fingerprint (`version`, the sha256 of the
+# source CSV computed by the resolver at load time), so derivations are keyed
+# on that string plus their scalar parameters. A lookup is a dict probe;
+# nothing ever hashes a DataFrame. Results are shared read-only by every
+# session of the process; concurrent misses of one key compute it once.
+#
+# Page scripts run top to bottom on every rerun, redefining their decorated
+# functions each time, so a function's cache is registered under where it is
+# defined (file and qualified name) and outlives the run that defined it.
+
+# Parameter types accepted in cache keys
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+_MISSING = object()
+
+# (defining file, qualified name) -> (results, flights) of a decorated function
+_caches = {}
+
+
+def _check_scalar(func, value):
+    if not isinstance(value, SCALAR_TYPES):
+        raise TypeError(
+            f"{func.__qualname__}: cached parameters must be scalars, got {type(value).__name__}"
+        )
+
+
+def cache_per_version(max_entries=1):
+    """Memoizes `func(catalog, *params)` on (catalog.version, params).
+
+    `params` must be scalars (str, int, float, bool, None). The decorated
+    function gains `clear()` and `cache_stats()`.
+    """
+    def decorator(func):
+        # Bounded by entry count only: results are arbitrary objects (frames, engines)
+        results, flights = _caches.setdefault(
+            (inspect.unwrap(func).__code__.co_filename, func.__qualname__),
+            (BoundedLRU(max_entries=max_entries, sizeof=lambda result: 0), SingleFlight()),
+        )
+
+        def compute(key, catalog, args, kwargs):
+            # Another caller may have finished this key between our miss and now
+            result = results.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(catalog, *args, **kwargs)
+                results.put(key, result)
+            return result
+
+        @functools.wraps(func)
+        def wrapper(catalog, *args, **kwargs):
+            for value in (*args, *kwargs.values()):
+                _check_scalar(func, value)
+            key = (catalog.version, args, tuple(sorted(kwargs.items())))
+            result = results.get(key, _MISSING)
+            if result is _MISSING:
+                result = flights.do(key, lambda: compute(key, catalog, args, kwargs))
+            return result
+
+        wrapper.clear = results.clear
+        wrapper.cache_stats = lambda: {**results.stats(), **flights.stats()}
+        return wrapper
+
+    return decorator
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# ------------------------------------------------------------
+# Incremental ingestion of catalog refreshes
+# ------------------------------------------------------------
+# A refreshed netflix_titles.csv is diffed against the previous catalog by
+# show_id. Rows are compared by a per-row hash, so only inserted, deleted and
+# updated titles are re-split into bridge rows, re-dated and re-aggregated
+# (see catalog.apply_delta); everything else is carried over. The patched
+# catalog keeps the refreshed CSV's row order, so it is laid out exactly like
+# a full build of the same file.
+
+KEY_COLUMN = 'show_id'
+
+# Above this share of changed titles a full rebuild is cheaper than patching
+MAX_CHANGED_SHARE = 0.5
+
+
+class TitleDelta:
+    """Row-level changes between two title frames.
+
+    Positions prefixed `old_` index the previous catalog; the others index
+    the refreshed title frame.
+    """
+
+    def __init__(self, old_kept, kept, old_updated, deleted, inserted):
+        self.old_kept = old_kept        # old positions still present
+        self.kept = kept                # ... and their positions in the new frame
+        self.old_updated = old_updated  # old positions whose row changed
+        self.deleted = deleted          # old positions no longer present
+        self.inserted = inserted        # new positions without an old row
+
+    def __len__(self):
+        return len(self.old_updated) + len(self.deleted) + len(self.inserted)
+
+    def __repr__(self):
+        return (f"TitleDelta(inserted={len(self.inserted)}, updated={len(self.old_updated)}, "
+                f"deleted={len(self.deleted)})")
+
+    def is_incremental(self, n_titles):
+        return len(self) <= MAX_CHANGED_SHARE * max(n_titles, 1)
+
+    def renumbering(self, n_old):
+        """Old title_id -> new title_id, its row in the new frame (-1 for deleted titles)."""
+        renumber = np.full(n_old, -1, dtype=np.int64)
+        renumber[self.old_kept] = self.kept
+        return renumber
+
+    def stale_ids(self):
+        """Old title_ids whose derived rows must be dropped (deleted or updated)."""
+        return np.sort(np.concatenate([self.deleted, self.old_updated]))
+
+    def unchanged_ids(self):
+        """Old title_ids carried over as-is."""
+        return np.setdiff1d(self.old_kept, self.old_updated, assume_unique=True)
+
+    def fresh_ids(self, renumber):
+        """New title_ids whose derived rows must be built (updated or inserted)."""
+        return np.sort(np.concatenate([renumber[self.old_updated], self.inserted]))
+
+
+def diff_titles(old, new, key=KEY_COLUMN):
+    """The TitleDelta turning `old` into `new`, matched on `key`.
+
+    Returns None when the frames cannot be diffed (no unique key, or the
+    columns differ), in which case the caller rebuilds from scratch.
+    """
+    if key not in old.columns or key not in new.columns or list(old.columns) != list(new.columns):
+        return None
+    old_keys, new_keys = pd.Index(old[key]), pd.Index(new[key])
+    if not (old_keys.is_unique and new_keys.is_unique):
+        return None
+
+    in_new = new_keys.get_indexer(old_keys)
+    old_kept = np.flatnonzero(in_new >= 0)
+    kept = in_new[old_kept]
+
+    old_hash = pd.util.hash_pandas_object(old.iloc[old_kept], index=False).to_numpy()
+    new_hash = pd.util.hash_pandas_object(new.iloc[kept], index=False).to_numpy()
+
+    return TitleDelta(
+        old_kept=old_kept,
+        kept=kept,
+        old_updated=old_kept[old_hash != new_hash],
+        deleted=np.flatnonzero(in_new < 0),
+        inserted=np.flatnonzero(old_keys.get_indexer(new_keys) < 0),
+    )
+
+
+def patch_bridge(bridge, name, renumber, stale, added):
+    """Bridge with the rows of `stale` titles dropped, the rest renumbered and `added` merged in.
+
+    `added` is the bridge built for the fresh titles (already keyed by new
+    title_ids). Rows stay ordered by title_id, and names no title lists any
+    more are dropped from the categories.
+    """
+    drop = np.zeros(len(renumber), dtype=bool)
+    drop[stale] = True
+    kept = bridge[~drop[bridge['title_id'].to_numpy()]]
+
+    title_ids = np.concatenate([
+        renumber[kept['title_id'].to_numpy()],
+        added['title_id'].to_numpy(),
+    ]).astype(np.int32)
+    values = union_categoricals([kept[name], added[name]], sort_categories=True)
+
+    order = np.argsort(title_ids, kind='stable')
+    return pd.DataFrame({
+        'title_id': title_ids[order],
+        name: values[order].remove_unused_categories(),
+    })
@@ -0,0 +1,56 @@
+import hashlib
+import json
+import os
+
+from lru import BoundedLRU
+from singleflight import SingleFlight
+
+# ------------------------------------------------------------
+# Content-addressed cache of built Plotly figures
+# ------------------------------------------------------------
+# The analytic tabs draw the same figures for every session. A figure is keyed
+# by the hash of (dataset fingerprint, chart id, parameters), built once per
+# process and kept in a byte-budgeted LRU; entries are charged the size of
+# their serialized JSON.
+#
+# Entries hold the built go.Figure rather than its JSON text: st.plotly_chart
+# re-validates dict / JSON specs on every call (about as slow as rebuilding),
+# while a Figure instance is only serialized. Cached figures are shared and
+# must not be modified by the pages. Concurrent misses of one key build the
+# figure once (single-flight).
+
+# Memory budget of the figure cache, in MiB
+FIGURE_CACHE_MB = float(os.environ.get("NETFLIX_FIGURE_CACHE_MB", "64"))
+
+_figures = BoundedLRU(max_bytes=int(FIGURE_CACHE_MB * 2**20), sizeof=lambda entry: entry[1])
+_builds = SingleFlight()
+
+
+def figure_key(fingerprint, chart_id, params=None):
+    """Content address of a figure: sha256 over its fingerprint, chart id and parameters."""
+    payload = json.dumps([fingerprint, chart_id, params or {}], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def cached_figure(fingerprint, chart_id, build, **params):
+    """The figure `build(**params)` for dataset `fingerprint`, built at most once while cached."""
+    key = figure_key(fingerprint, chart_id, params)
+    entry = _figures.get(key)
+    if entry is None:
+        entry = _builds.do(key, lambda: _build_entry(key, build, params))
+    return entry[0]
+
+
+def _build_entry(key, build, params):
+    # Another caller may have finished this figure between our miss and now
+    entry = _figures.get(key)
+    if entry is None:
+        figure = build(**params)
+        entry = (figure, len(figure.to_json()))
+        _figures.put(key, entry)
+    return entry
+
+
+def cache_stats():
+    """Entry count, bytes and hit / miss / eviction counters of the figure cache, plus single-flight counters."""
+    return {**_figures.stats(), **_builds.stats()}
@@ -0,0 +1,133 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from lru import BoundedLRU
+from search_index import EMPTY_POSTINGS, PostingIndex, intersect
+from typeahead import TypeaheadIndex
+
+# ------------------------------------------------------------
+# Bitmap-indexed filter engine for the Content Explorer
+# ------------------------------------------------------------
+# Low-cardinality columns (type, rating, year) get one packed bitmap per value
+# (np.packbits, 1 bit per title). High-cardinality fields (title, cast,
+# director) use posting lists of title_ids. A query ANDs the bitmaps,
+# intersects the posting lists and only returns row ids; the caller
+# materializes rows once at the end. Results are cached per normalized filter
+# combination in a bounded LRU shared by every session using the engine.
+
+BITMAP_FIELDS = ["type", "rating", "year"]
+
+# Budget of the query-result cache (row-id arrays)
+QUERY_CACHE_ENTRIES = int(os.environ.get("NETFLIX_QUERY_CACHE_ENTRIES", "512"))
+QUERY_CACHE_MB = float(os.environ.get("NETFLIX_QUERY_CACHE_MB", "16"))
+
+
+def year_column(catalog):
+    """Release year, falling back to the year added when release_year is absent."""
+    if 'release_year' in catalog.titles.columns:
+        return catalog.titles['release_year']
+    return catalog.dates['year_added']
+
+
+def _bitmaps(values):
+    """{value: packed bitmap} for every distinct non-null value of `values`."""
+    codes, uniques = pd.factorize(values, sort=True)
+    return {
+        value: np.packbits(codes == code)
+        for code, value in enumerate(uniques.tolist())
+    }
+
+
+def query_key(filters):
+    """Normalized cache key of a filter combination (order-independent)."""
+    return tuple(sorted(filters.items()))
+
+
+def _test_bits(packed, ids):
+    """Boolean mask telling which row ids are set in a packed bitmap."""
+    return ((packed[ids >> 3] >> (7 - (ids & 7))) & 1).astype(bool)
+
+
+class FilterEngine:
+    """Answers Content Explorer filter combinations as sorted int32 row ids."""
+
+    def __init__(self, catalog):
+        titles = catalog.titles
+        self.size = len(titles)
+
+        columns = {'type': titles.get('type'), 'rating': titles.get('rating'), 'year': year_column(catalog)}
+        self.bitmaps = {
+            field: _bitmaps(values)
+            for field, values in columns.items()
+            if values is not None
+        }
+
+        title_bridge = pd.DataFrame({
+            'title_id': np.arange(self.size, dtype=np.int32),
+            'title': pd.Categorical(titles['title'].astype("string")),
+        }).dropna()
+        self.indexes = {'title': PostingIndex(title_bridge, 'title')}
+        self.indexes.update(catalog.indexes)
+
+        self._catalog = catalog
+        self._title_typeahead = TypeaheadIndex.from_postings(self.indexes['title'])
+        self._results = BoundedLRU(
+            max_entries=QUERY_CACHE_ENTRIES,
+            max_bytes=int(QUERY_CACHE_MB * 2**20),
+            sizeof=lambda ids: ids.nbytes,
+        )
+
+    def options(self, field):
+        """Sorted distinct values of a filter field (what the selectboxes offer)."""
+        if field in self.bitmaps:
+            return list(self.bitmaps[field])
+        if field in self.indexes:
+            return self.indexes[field].names.tolist()
+        return []
+
+    def typeahead(self, field):
+        """Server-side search over the values of a title / cast / director filter."""
+        if field == 'title':
+            return self._title_typeahead
+        return self._catalog.typeahead(field)
+
+    def query(self, filters):
+        """Sorted int32 row ids matching every `field -> value` pair in `filters`.
+
+        The returned array is shared through the result cache and read-only.
+        """
+        key = query_key(filters)
+        ids = self._results.get(key)
+        if ids is None:
+            ids = self._query(filters)
+            # Shared between sessions: freeze it (posting-list slices stay views)
+            ids.setflags(write=False)
+            self._results.put(key, ids)
+        return ids
+
+    def cache_stats(self):
+        """Entry count, bytes and hit / miss / eviction counters of the query-result cache."""
+        return self._results.stats()
+
+    def _query(self, filters):
+        packed = None
+        id_lists = []
+        for field, value in filters.items():
+            if field in self.bitmaps:
+                bitmap = self.bitmaps[field].get(value)
+                if bitmap is None:
+                    return EMPTY_POSTINGS
+                packed = bitmap if packed is None else packed & bitmap
+            elif field in self.indexes:
+                id_lists.append(self.indexes[field].lookup(value))
+            else:
+                raise KeyError(f"Unknown filter field: {field}")
+
+        if id_lists:
+            ids = intersect(id_lists)
+            return ids if packed is None else ids[_test_bits(packed, ids)]
+        if packed is None:
+            return np.arange(self.size, dtype=np.int32)
+        return np.flatnonzero(np.unpackbits(packed, count=self.size)).astype(np.int32)
@@ -0,0 +1,98 @@
+import os
+
+import pandas as pd
+
+import resolver
+from atomic_files import has_stamp, write_stamped_parquet
+
+# ------------------------------------------------------------
+# IMDb enrichment behind the talent plots (D, E)
+# ------------------------------------------------------------
+# The IMDb-joined titles file is exploded by cast member once per input-file
+# fingerprint (its sha256). The two aggregates the plots need are written
+# next to the source as Parquet, stamped with that fingerprint, and later
+# runs read them back instead of re-parsing and re-exploding the CSV:
+#
+#   actor_country_rating  mean IMDb rating per (country, actor)
+#   country_actor_counts  distinct cast members per country, largest first
+
+IMDB_CSV_PATH = os.path.join('Plotting data', 'netflix_titles_with_imdb_ratings_2.csv')
+REQUIRED_COLUMNS = ['cast', 'averagerating', 'country']
+ARTIFACTS = ('actor_country_rating', 'country_actor_counts')
+
+# Key stored in the Parquet schema metadata to detect stale artifacts
+META_SOURCE_SHA256 = b"netflix.source_sha256"
+
+
+class MissingColumnsError(ValueError):
+    """Raised when the IMDb file lacks one of REQUIRED_COLUMNS."""
+
+
+def artifact_path_for(csv_path, name):
+    """Artifacts live next to the CSV they were built from."""
+    return f"{os.path.splitext(csv_path)[0]}.{name}.parquet"
+
+
+def _actor_rows(df):
+    """One row per (title, cast member); cast lists are split on ',' and stripped."""
+    rows = df.assign(actor=df['cast'].str.split(',')).explode('actor')
+    rows['actor'] = rows['actor'].str.strip()
+    return rows.dropna(subset=['actor'])
+
+
+def enrich(df):
+    """Builds the Plot D / E aggregates from the raw IMDb frame."""
+    df = df.copy()
+    df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise MissingColumnsError(f"IMDb file is missing column(s): {missing}")
+
+    actors = _actor_rows(df[REQUIRED_COLUMNS].dropna(subset=['country', 'cast']))
+
+    rated = actors.dropna(subset=['averagerating'])
+    actor_country_rating = rated.groupby(['country', 'actor'], as_index=False)['averagerating'].mean()
+
+    country_actor_counts = (
+        actors.drop_duplicates(subset=['country', 'actor'])['country']
+        .value_counts()
+        .rename_axis('country')
+        .reset_index(name='unique_actor_count')
+    )
+    return {
+        'actor_country_rating': actor_country_rating,
+        'country_actor_counts': country_actor_counts,
+    }
+
+
+def _source_stamp(fingerprint):
+    return {META_SOURCE_SHA256: fingerprint.encode()}
+
+
+def load_enrichment(csv_path=IMDB_CSV_PATH, fingerprint=None):
+    """The Plot D / E aggregates of `csv_path`, (re)built only when its fingerprint changed."""
+    fingerprint = fingerprint or resolver.file_sha256(csv_path)
+    paths = {name: artifact_path_for(csv_path, name) for name in ARTIFACTS}
+
+    if all(has_stamp(path, _source_stamp(fingerprint)) for path in paths.values()):
+        return {name: pd.read_parquet(path) for name, path in paths.items()}
+
+    frames = enrich(pd.read_csv(csv_path))
+    try:
+        for name, path in paths.items():
+            write_stamped_parquet(frames[name], path, _source_stamp(fingerprint))
+    except OSError:
+        # Read-only data directory: serve the aggregates without persisting them
+        pass
+    return frames
+
+
+def top_rated_actors(actor_country_rating, n=15):
+    """Plot D rows: the (country, actor) ratings of the `n` actors with the best mean rating."""
+    top = actor_country_rating.groupby('actor')['averagerating'].mean().nlargest(n).index
+    return actor_country_rating[actor_country_rating['actor'].isin(top)]
+
+
+def top_countries_by_actors(country_actor_counts, n=5):
+    """Plot E rows: the `n` countries with the most distinct cast members."""
+    return country_actor_counts.head(n).reset_index(drop=True)
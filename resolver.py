@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+
+from atomic_files import replace_atomically
+
+# ------------------------------------------------------------
+# Offline-first resolver for netflix_titles.csv
+# ------------------------------------------------------------
+# Every page resolves the dataset through here. Local copies are checked in
+# order (configured mirror directory, then the working directory) and the
+# network is only touched when no valid local copy exists.
+#
+# Configuration (environment variables):
+#   NETFLIX_DATA_DIR     local mirror directory checked first
+#   NETFLIX_DATA_SHA256  expected sha256 of the CSV; a "<csv>.sha256"
+#                        sidecar file next to a copy is honoured as well
+#   NETFLIX_OFFLINE      "1" forbids the KaggleHub fallback entirely
+
+CSV_NAME = "netflix_titles.csv"
+KAGGLE_DATASET = "shivamb/netflix-shows"
+MANIFEST_PATH = "dataset_manifest.json"
+
+MIRROR_DIR_ENV = "NETFLIX_DATA_DIR"
+SHA256_ENV = "NETFLIX_DATA_SHA256"
+OFFLINE_ENV = "NETFLIX_OFFLINE"
+
+_CHUNK_SIZE = 1 << 20
+
+
+class DatasetChecksumError(ValueError):
+    """Raised when the only available copy of the dataset fails its checksum."""
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_manifest():
+    try:
+        with open(MANIFEST_PATH) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _dump_json(record, path):
+    with open(path, "w") as fh:
+        json.dump(record, fh, indent=2)
+
+
+def _write_manifest(record):
+    try:
+        replace_atomically(MANIFEST_PATH, lambda tmp_path: _dump_json(record, tmp_path))
+    except OSError:
+        # Read-only working directory: the in-memory record is still available
+        pass
+
+
+def _expected_sha256(csv_path):
+    expected = os.environ.get(SHA256_ENV)
+    if expected:
+        return expected.strip().lower()
+    sidecar = f"{csv_path}.sha256"
+    if os.path.exists(sidecar):
+        with open(sidecar) as fh:
+            # Accept both a bare digest and "sha256sum" output
+            return fh.read().split()[0].lower()
+    return None
+
+
+def _checksum(csv_path, manifest):
+    """Returns the file's sha256, reusing the manifest when size and mtime are unchanged."""
+    stat = os.stat(csv_path)
+    if (
+        manifest.get("path") == os.path.abspath(csv_path)
+        and manifest.get("size") == stat.st_size
+        and manifest.get("mtime_ns") == stat.st_mtime_ns
+        and manifest.get("sha256")
+    ):
+        return manifest["sha256"], stat
+    return file_sha256(csv_path), stat
+
+
+def local_candidates():
+    """Local locations checked before the network, in priority order."""
+    candidates = []
+    mirror_dir = os.environ.get(MIRROR_DIR_ENV)
+    if mirror_dir:
+        candidates.append(os.path.join(mirror_dir, CSV_NAME))
+    candidates.append(CSV_NAME)
+    return candidates
+
+
+def _validate(csv_path, manifest, source):
+    sha256, stat = _checksum(csv_path, manifest)
+    expected = _expected_sha256(csv_path)
+    if expected and sha256 != expected:
+        raise DatasetChecksumError(
+            f"Checksum mismatch for '{csv_path}': expected {expected}, got {sha256}"
+        )
+    return {
+        "path": os.path.abspath(csv_path),
+        "source": source,
+        "sha256": sha256,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "verified": expected is not None,
+    }
+
+
+def _download():
+    # Imported lazily so air-gapped deployments never load the network client
+    import kagglehub
+
+    path = kagglehub.dataset_download(KAGGLE_DATASET)
+    return os.path.join(path, CSV_NAME)
+
+
+_resolved = None
+
+
+def _is_unchanged(record):
+    try:
+        stat = os.stat(record["path"])
+    except OSError:
+        return False
+    return stat.st_size == record["size"] and stat.st_mtime_ns == record["mtime_ns"]
+
+
+def resolve():
+    """Resolves the dataset to a validated local CSV and records the resolution.
+
+    Returns a dict with the absolute ``path``, where it came from (``source``),
+    its ``sha256`` and file stats. The result is memoized per process.
+    """
+    global _resolved
+    if _resolved is not None and _is_unchanged(_resolved):
+        return _resolved
+
+    manifest = _read_manifest()
+    errors = []
+    for candidate in local_candidates():
+        if not os.path.exists(candidate):
+            continue
+        try:
+            record = _validate(candidate, manifest, "local")
+            break
+        except DatasetChecksumError as e:
+            errors.append(str(e))
+    else:
+        if os.environ.get(OFFLINE_ENV) == "1":
+            detail = "; ".join(errors) or f"no copy found in {local_candidates()}"
+            raise FileNotFoundError(f"Dataset '{CSV_NAME}' unavailable offline: {detail}")
+        record = _validate(_download(), manifest, "kagglehub")
+
+    if record != manifest:
+        _write_manifest(record)
+    _resolved = record
+    return record
+
+
+def resolve_csv_path():
+    return resolve()["path"]
+
+
+def last_resolution():
+    """The record of the most recent resolution in this process, if any."""
+    return _resolved
@@ -0,0 +1,77 @@
+import math
+
+import streamlit as st
+
+# ------------------------------------------------------------
+# Paginated, column-projected result grid
+# ------------------------------------------------------------
+# Only one page of rows and only the visible columns are sent to the browser
+# per rerun. The page offset lives in session state, and long text (the
+# description) is fetched for a single row when that row is selected. The grid
+# is its own fragment: paging or selecting a row reruns only the grid.
+
+GRID_COLUMNS = ['title', 'type', 'release_year', 'rating', 'director', 'country', 'duration', 'listed_in']
+PAGE_SIZES = [25, 50, 100]
+DETAIL_COLUMN = 'description'
+
+
+def _state_keys(key):
+    return f"{key}_page", f"{key}_page_size", f"{key}_query"
+
+
+def _set_page(page_key, page):
+    st.session_state[page_key] = page
+
+
+@st.fragment
+def render_result_grid(titles, row_ids, key, query=None, columns=GRID_COLUMNS):
+    """Renders one page of `titles.iloc[row_ids]` with pager controls.
+
+    `query` identifies the current filter combination; the grid jumps back
+    to the first page whenever it changes.
+    """
+    page_key, size_key, query_key = _state_keys(key)
+    if st.session_state.get(query_key) != query:
+        st.session_state[query_key] = query
+        st.session_state[page_key] = 0
+    st.session_state.setdefault(page_key, 0)
+    st.session_state.setdefault(size_key, PAGE_SIZES[0])
+
+    page_size = st.session_state[size_key]
+    n_pages = max(1, math.ceil(len(row_ids) / page_size))
+    page = min(max(st.session_state[page_key], 0), n_pages - 1)
+    st.session_state[page_key] = page
+
+    # Slice row ids first, then materialize only this page's visible columns
+    page_ids = row_ids[page * page_size:(page + 1) * page_size]
+    visible = [c for c in columns if c in titles.columns]
+    page_df = titles.iloc[page_ids][visible].reset_index(drop=True)
+
+    event = st.dataframe(
+        page_df,
+        use_container_width=True,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key=f"{key}_grid_{page}",
+    )
+
+    col_prev, col_info, col_size, col_next = st.columns([1, 2, 1, 1])
+    with col_prev:
+        st.button("Previous", key=f"{key}_prev", disabled=page == 0,
+                  on_click=_set_page, args=(page_key, page - 1))
+    with col_info:
+        st.markdown(f"Page {page + 1} of {n_pages}")
+    with col_size:
+        st.selectbox("Rows per page", PAGE_SIZES, key=size_key, label_visibility="collapsed",
+                     on_change=_set_page, args=(page_key, 0))
+    with col_next:
+        st.button("Next", key=f"{key}_next", disabled=page >= n_pages - 1,
+                  on_click=_set_page, args=(page_key, page + 1))
+
+    # Lazily load the long description for the selected row only
+    selected = event.selection.rows if event is not None else []
+    if selected and DETAIL_COLUMN in titles.columns and selected[0] < len(page_ids):
+        row_id = page_ids[selected[0]]
+        with st.expander(f"Description — {titles['title'].iat[row_id]}", expanded=True):
+            st.write(titles[DETAIL_COLUMN].iat[row_id])
@@ -0,0 +1,73 @@
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+# ------------------------------------------------------------
+# Inverted index: name -> sorted posting list of title_ids
+# ------------------------------------------------------------
+# Built once from a catalog bridge table (see catalog.py). A lookup is a hash
+# probe plus a slice, so its cost is proportional to the number of matching
+# titles rather than the catalog size, and names match exactly ("Ali" does
+# not match "Alia Bhatt").
+
+EMPTY_POSTINGS = np.empty(0, dtype=np.int32)
+
+
+def intersect(lists):
+    """Intersection of sorted, duplicate-free posting lists."""
+    # Intersect shortest lists first so the running result shrinks fastest
+    lists = sorted(lists, key=len)
+    if not lists:
+        return EMPTY_POSTINGS
+    result = lists[0]
+    for postings in lists[1:]:
+        if len(result) == 0:
+            break
+        result = np.intersect1d(result, postings, assume_unique=True)
+    return result.astype(np.int32, copy=False)
+
+
+class PostingIndex:
+    """Exact-name lookups over one bridge (e.g. cast or director)."""
+
+    def __init__(self, bridge, name):
+        values = bridge[name]
+        codes = values.cat.codes.to_numpy()
+        title_ids = bridge['title_id'].to_numpy(dtype=np.int32)
+
+        # Group postings by name code, each posting list sorted by title_id
+        order = np.lexsort((title_ids, codes))
+        self.postings = title_ids[order]
+        counts = np.bincount(codes, minlength=len(values.cat.categories))
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        self.names = pd.Index(values.cat.categories)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def lookup(self, name):
+        """Sorted int32 title_ids whose list contains `name` exactly."""
+        try:
+            code = self.names.get_loc(name)
+        except KeyError:
+            return EMPTY_POSTINGS
+        return self.postings[self.offsets[code]:self.offsets[code + 1]]
+
+    def frequency(self, name):
+        """Number of titles listing `name`."""
+        return len(self.lookup(name))
+
+    def any_of(self, names):
+        """Titles listing at least one of `names` (posting-list union)."""
+        lists = [self.lookup(n) for n in names]
+        if not lists:
+            return EMPTY_POSTINGS
+        return reduce(np.union1d, lists).astype(np.int32, copy=False)
+
+    def all_of(self, names):
+        """Titles listing every one of `names` (posting-list intersection)."""
+        return intersect([self.lookup(n) for n in names])
@@ -0,0 +1,20 @@
+import streamlit as st
+
+# ------------------------------------------------------------
+# Lazily evaluated page sections
+# ------------------------------------------------------------
+# st.expander / st.tabs always run their body (the server does not know
+# whether they are open), so a lazy section is a toggle instead: while it is
+# off nothing inside is computed. Each section runs in its own fragment, so
+# opening one or interacting with it reruns only that section.
+
+
+def lazy_section(label, key, render, expanded=False):
+    """Renders `render()` below a toggle, in its own fragment, only while the toggle is on."""
+
+    @st.fragment
+    def section():
+        if st.toggle(label, value=expanded, key=key):
+            render()
+
+    section()
@@ -0,0 +1,75 @@
+import os
+import threading
+
+# ------------------------------------------------------------
+# Single-flight coalescing of concurrent cache misses
+# ------------------------------------------------------------
+# Sessions run in threads of one process. When several of them miss the same
+# cache key at once (fan-out after a deploy or an eviction), the first one
+# computes and the others wait for its result instead of computing it again.
+# A failure is re-raised in every waiting caller; a waiter that gives up after
+# the timeout gets SingleFlightTimeout while the computation carries on.
+
+# Seconds a caller waits for another caller's computation of the same key
+WAIT_TIMEOUT = float(os.environ.get("NETFLIX_SINGLEFLIGHT_TIMEOUT", "120"))
+
+
+class SingleFlightTimeout(TimeoutError):
+    """Raised when an in-flight computation of the same key did not finish in time."""
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Runs at most one computation per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self, timeout=None):
+        self.timeout = WAIT_TIMEOUT if timeout is None else timeout
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.computed = 0
+        self.shared = 0
+
+    def do(self, key, compute, timeout=None):
+        """`compute()`, or the result of the call already computing `key`."""
+        timeout = self.timeout if timeout is None else timeout
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+                    self.computed += 1
+                else:
+                    self.shared += 1
+
+            if leader:
+                return self._lead(key, call, compute)
+
+            if not call.done.wait(timeout):
+                raise SingleFlightTimeout(f"Timed out after {timeout:g} s waiting for {key!r}")
+            if call.error is None:
+                return call.result
+            if isinstance(call.error, Exception):
+                raise call.error
+            # The computing session was interrupted (rerun / stop): compute it here instead
+
+    def _lead(self, key, call, compute):
+        try:
+            call.result = compute()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self):
+        return {"in_flight": len(self._calls), "computed": self.computed, "shared": self.shared}
@@ -0,0 +1,91 @@
+import os
+
+import pandas as pd
+
+import resolver
+from atomic_files import has_stamp, write_stamped_parquet
+
+# ------------------------------------------------------------
+# Typed Parquet snapshot of netflix_titles.csv
+# ------------------------------------------------------------
+# The CSV is parsed once and written next to itself as a typed Parquet file.
+# Every page loads the snapshot instead of re-running pd.read_csv and dtype
+# inference; the snapshot is rebuilt only when the CSV changes on disk.
+
+CATEGORICAL_COLUMNS = ["type", "rating"]
+DATE_ADDED_FORMAT = "%B %d, %Y"
+
+# Keys stored in the Parquet schema metadata to detect a stale snapshot
+META_SOURCE_SIZE = b"netflix.source_size"
+META_SOURCE_MTIME = b"netflix.source_mtime_ns"
+
+
+def snapshot_path_for(csv_path):
+    """The snapshot lives next to the CSV it was built from."""
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+def _source_stamp(csv_path):
+    stat = os.stat(csv_path)
+    return {
+        META_SOURCE_SIZE: str(stat.st_size).encode(),
+        META_SOURCE_MTIME: str(stat.st_mtime_ns).encode(),
+    }
+
+
+def parse_date_added(values):
+    """Parses date_added with the dataset's explicit format, inferring only the leftovers."""
+    values = values.astype("string").str.strip()
+    parsed = pd.to_datetime(values, format=DATE_ADDED_FORMAT, errors="coerce")
+    leftover = parsed.isna() & values.notna() & (values != "")
+    if leftover.any():
+        parsed[leftover] = pd.to_datetime(values[leftover], format="mixed", errors="coerce")
+    return parsed
+
+
+def to_typed_frame(df):
+    """Applies the snapshot dtypes to a freshly parsed catalog frame."""
+    df = df.copy()
+    # Normalize columns for consistency across pages
+    df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
+
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    if 'release_year' in df.columns:
+        years = pd.to_numeric(df['release_year'], errors='coerce')
+        df['release_year'] = years.astype("Int16" if years.isna().any() else "int16")
+
+    if 'date_added' in df.columns:
+        df['date_added'] = parse_date_added(df['date_added'])
+
+    return df
+
+
+def build_snapshot(csv_path, snapshot_path=None):
+    """Parses the CSV once and writes the typed Parquet snapshot atomically."""
+    snapshot_path = snapshot_path or snapshot_path_for(csv_path)
+    df = to_typed_frame(pd.read_csv(csv_path))
+
+    write_stamped_parquet(df, snapshot_path, _source_stamp(csv_path))
+    return df
+
+
+def is_snapshot_fresh(csv_path, snapshot_path):
+    return has_stamp(snapshot_path, _source_stamp(csv_path))
+
+
+def load_catalog(csv_path=None):
+    """Loads the catalog from its Parquet snapshot, (re)building it from the CSV when stale."""
+    csv_path = csv_path or resolver.resolve_csv_path()
+    snapshot_path = snapshot_path_for(csv_path)
+
+    if is_snapshot_fresh(csv_path, snapshot_path):
+        return pd.read_parquet(snapshot_path)
+
+    try:
+        return build_snapshot(csv_path, snapshot_path)
+    except OSError:
+        # Read-only data directory: serve the typed frame without persisting it
+        return to_typed_frame(pd.read_csv(csv_path))
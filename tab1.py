@@ -3,6 +3,10 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+
+from catalog import get_catalog
+from cube import get_cube
+from figure_cache import cached_figure
 # REMOVED: from sklearn.feature_extraction.text import CountVectorizer
 
 st.set_page_config(layout="wide", page_title="Netflix Insights Dashboard")
@@ -134,8 +138,9 @@ def update_fig_style(fig, title):
 glow_card("Top Country Content Distribution")
 
 try:
-	# Assuming 'netflix_df' is loaded into session_state elsewhere
-	dfn = st.session_state['netflix_df'].copy()
+	# Shared read-only catalog (no per-session copy)
+	catalog = get_catalog()
+	dfn = catalog.titles
 
 	all_count1 = dfn['country'].value_counts()
 	mcpctrs1 = all_count1.head(10).copy()
@@ -161,32 +166,37 @@ try:
 	row1_col1, row1_col2 = st.columns([2, 3])
 
 	with row1_col1:
-		# Using Plotly Express for the Pie Chart
-		fig1 = px.pie(
-			plot1_data,
-			names='Country',
-			values='Count',
-			title='Content Distribution (Top 10 + Others)',
-			color_discrete_sequence=netflix_colors
-		)
-		fig1.update_traces(
-			textposition='inside',
-			textinfo='percent+label',
-			marker=dict(line=dict(color='#000000', width=1)),
-			hole=0.3,
-			textfont=dict(color='white')
-		)
+		def plot_country_pie():
+			# Using Plotly Express for the Pie Chart
+			fig1 = px.pie(
+				plot1_data,
+				names='Country',
+				values='Count',
+				title='Content Distribution (Top 10 + Others)',
+				color_discrete_sequence=netflix_colors
+			)
+			fig1.update_traces(
+				textposition='inside',
+				textinfo='percent+label',
+				marker=dict(line=dict(color='#000000', width=1)),
+				hole=0.3,
+				textfont=dict(color='white')
+			)
 		
-		# Apply dark theme style
-		fig1.update_layout(
-			plot_bgcolor='black',
-			paper_bgcolor='black',
-			title=dict(text='Content Distribution (Top 10 + Others)', x=0.5, font=dict(color="#E50914"), xanchor='center'),
-			font=dict(color='white'),
-			# add left margin so pie chart sits a bit to the right (more centered visually)
-			margin=dict(t=30, b=0, l=80, r=20),
-			legend=dict(font=dict(color='white'))
-		)
+			# Apply dark theme style
+			fig1.update_layout(
+				plot_bgcolor='black',
+				paper_bgcolor='black',
+				title=dict(text='Content Distribution (Top 10 + Others)', x=0.5, font=dict(color="#E50914"), xanchor='center'),
+				font=dict(color='white'),
+				# add left margin so pie chart sits a bit to the right (more centered visually)
+				margin=dict(t=30, b=0, l=80, r=20),
+				legend=dict(font=dict(color='white'))
+			)
+			return fig1
+
+		# Figures are built once per dataset version (content-addressed figure cache)
+		fig1 = cached_figure(catalog.version, 'tab1.country_pie', plot_country_pie)
 
 		# st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
 		st.plotly_chart(fig1, use_container_width=True)
@@ -205,7 +215,7 @@ try:
 		""", unsafe_allow_html=True)
 
 except KeyError:
-	st.error("Please ensure the DataFrame is loaded into st.session_state['netflix_df'].")
+	st.error("Please ensure the Netflix dataset is available to the shared catalog.")
 except Exception as e:
 	st.error(f"An error occurred loading data for Plot 1: {e}")
 	dfn = None
@@ -216,41 +226,30 @@ end_card()
 # =========================================================
 
 try:
-	# Using the absolute path that fixed the error from before
-	df = st.session_state['netflix_df'].copy()
-	df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce')
+	catalog = get_catalog()
 
 	# --- Process for Plot 2 ---
-	df_lag = df.copy()
-	df_lag['release_date'] = pd.to_datetime(df_lag['release_year'], format='%Y', errors='coerce')
-	df_lag['lag_days'] = (df_lag['date_added'] - df_lag['release_date']).dt.days
-	df_lag = df_lag[df_lag['lag_days'].between(0, 5000)]
-	df_lag['year_added'] = df_lag['date_added'].dt.year
-
+	# Counts and mean lags are rolled up from the pre-aggregated cube
+	cube = get_cube(catalog)
 	avg_lag_yearly = (
-		df_lag.groupby(['year_added', 'type'])['lag_days']
-		.mean()
+		cube.rollup(['year_added', 'type'], measure='lag_days')
 		.reset_index(name='lag_days')
 		.sort_values('year_added')
 	)
 	
 	# --- KPI Calculations for Plot 2 ---
-	avg_lag_movie = df_lag[df_lag['type'] == 'Movie']['lag_days'].mean()
-	avg_lag_tv = df_lag[df_lag['type'] == 'TV Show']['lag_days'].mean()
+	avg_lag_by_type = cube.rollup('type', measure='lag_days')
+	avg_lag_movie = avg_lag_by_type.get('Movie', np.nan)
+	avg_lag_tv = avg_lag_by_type.get('TV Show', np.nan)
 	lag_diff = avg_lag_movie - avg_lag_tv
 	# --- End KPI Calculations ---
 
 
 	# --- Process for Plot 3 ---
-	df_growth = df.copy()
-	df_growth['release_year'] = pd.to_numeric(df_growth['release_year'], errors='coerce')
-	
 	yearly_counts = (
-		df_growth.groupby(['release_year', 'type'])
-		.size()
-		.reset_index(name='count')
-		.pivot(index='release_year', columns='type', values='count')
-		.fillna(0)
+		cube.rollup(['release_year', 'type'])
+		.unstack('type', fill_value=0)
+		.astype(float)
 	)
 
 	yearly_growth = yearly_counts.diff().fillna(0).reset_index()
@@ -272,20 +271,24 @@ try:
 	row2_col1, row2_col2 = st.columns([2, 3])
 
 	with row2_col1:
-		fig2 = px.line(
-			avg_lag_yearly,
-			x='year_added',
-			y='lag_days',
-			color='type',
-			markers=True,
-			title='Avg Lag: Release → Netflix Add (Movies vs TV)',
-			color_discrete_sequence=['#FF4C4C', '#B22222']
-		)
-		
-		# Apply dark theme style
-		fig2 = update_fig_style(fig2, 'Avg Lag: Release → Netflix Add (Movies vs TV)')
-		fig2.update_traces(line=dict(width=3), marker=dict(size=8))
+		def plot_avg_lag():
+			fig2 = px.line(
+				avg_lag_yearly,
+				x='year_added',
+				y='lag_days',
+				color='type',
+				markers=True,
+				title='Avg Lag: Release → Netflix Add (Movies vs TV)',
+				color_discrete_sequence=['#FF4C4C', '#B22222']
+			)
 		
+			# Apply dark theme style
+			fig2 = update_fig_style(fig2, 'Avg Lag: Release → Netflix Add (Movies vs TV)')
+			fig2.update_traces(line=dict(width=3), marker=dict(size=8))
+			return fig2
+
+		fig2 = cached_figure(catalog.version, 'tab1.avg_lag', plot_avg_lag)
+
 		# st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
 		st.plotly_chart(fig2, use_container_width=True)
 		st.markdown("</div>", unsafe_allow_html=True)
@@ -318,49 +321,53 @@ try:
 	row3_col1, row3_col2 = st.columns([2, 3])
 
 	with row3_col1:
-		fig3 = go.Figure()
-
-		fig3.add_trace(go.Scatter(
-			x=yearly_growth['release_year'],
-			y=yearly_growth.get('Movie', 0),
-			mode='lines+markers',
-			name='Movie',
-			line=dict(color=COLOR_MOVIE, width=2),
-			marker=dict(size=6)
-		))
-
-		fig3.add_trace(go.Scatter(
-			x=yearly_growth['release_year'],
-			y=yearly_growth.get('TV Show', 0),
-			mode='lines+markers',
-			name='TV Show',
-			line=dict(color=COLOR_TVSHOW, width=2.5),
-			marker=dict(size=6)
-		))
-
-		x_fill = yearly_growth['release_year']
-		y_upper = yearly_growth.get('TV Show', pd.Series(0))
-		y_lower = yearly_growth.get('Movie', pd.Series(0))
-
-		fig3.add_trace(go.Scatter(
-			x=pd.concat([x_fill, x_fill[::-1]]),
-			y=pd.concat([pd.Series(np.maximum(y_upper, y_lower)), pd.Series(y_lower[::-1])]),
-			fill='toself',
-			fillcolor=COLOR_FILL,
-			line=dict(color='rgba(255,255,255,0)'),
-			hoverinfo='skip',
-			showlegend=True,
-			name='TV Shows > Movies'
-		))
-
-		# Apply dark theme style
-		fig3 = update_fig_style(fig3, 'YoY Growth: Movies vs TV Shows (Since 2005)')
-		fig3.update_layout(
-			xaxis_title='Release Year',
-			yaxis_title='YoY Growth',
-			hovermode='x unified',
-			height=500
-		)
+		def plot_yoy_growth():
+			fig3 = go.Figure()
+
+			fig3.add_trace(go.Scatter(
+				x=yearly_growth['release_year'],
+				y=yearly_growth.get('Movie', 0),
+				mode='lines+markers',
+				name='Movie',
+				line=dict(color=COLOR_MOVIE, width=2),
+				marker=dict(size=6)
+			))
+
+			fig3.add_trace(go.Scatter(
+				x=yearly_growth['release_year'],
+				y=yearly_growth.get('TV Show', 0),
+				mode='lines+markers',
+				name='TV Show',
+				line=dict(color=COLOR_TVSHOW, width=2.5),
+				marker=dict(size=6)
+			))
+
+			x_fill = yearly_growth['release_year']
+			y_upper = yearly_growth.get('TV Show', pd.Series(0))
+			y_lower = yearly_growth.get('Movie', pd.Series(0))
+
+			fig3.add_trace(go.Scatter(
+				x=pd.concat([x_fill, x_fill[::-1]]),
+				y=pd.concat([pd.Series(np.maximum(y_upper, y_lower)), pd.Series(y_lower[::-1])]),
+				fill='toself',
+				fillcolor=COLOR_FILL,
+				line=dict(color='rgba(255,255,255,0)'),
+				hoverinfo='skip',
+				showlegend=True,
+				name='TV Shows > Movies'
+			))
+
+			# Apply dark theme style
+			fig3 = update_fig_style(fig3, 'YoY Growth: Movies vs TV Shows (Since 2005)')
+			fig3.update_layout(
+				xaxis_title='Release Year',
+				yaxis_title='YoY Growth',
+				hovermode='x unified',
+				height=500
+			)
+			return fig3
+
+		fig3 = cached_figure(catalog.version, 'tab1.yoy_growth', plot_yoy_growth)
 
 		# st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
 		st.plotly_chart(fig3, use_container_width=True)
@@ -382,6 +389,6 @@ try:
 
 
 except KeyError:
-	st.error("Please ensure the DataFrame is loaded into st.session_state['netflix_df'].")
+	st.error("Please ensure the Netflix dataset is available to the shared catalog.")
 except Exception as e:
 	st.error(f"An error occurred loading or processing data for Plots 2 & 3: {e}")
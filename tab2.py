@@ -1,10 +1,15 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
 import numpy as np
 import os # Import os for better path handling
 
+from catalog import get_catalog
+from dataset_cache import cache_per_version
+from filter_engine import FilterEngine
+from typeahead import suggestions
+from result_grid import render_result_grid
+
 # --- Configuration & Setup ---
 st.set_page_config(layout="wide")
 st.markdown("""
@@ -79,52 +84,39 @@ st.markdown("""
 
 st.title(" Netflix Dataset Viewer")
 
-# --- Load DataFrame Safely ---
-# Use the uploaded file name to load the data if not already in session state
-FILE_ID = "netflix_titles.csv"
-if 'netflix_df' not in st.session_state:
-    try:
-        # Load the uploaded CSV file
-        df = pd.read_csv(FILE_ID)
-        st.session_state['netflix_df'] = df
-    except FileNotFoundError:
-        st.error(f"Error: Could not find the file '{FILE_ID}'. Please ensure it is uploaded.")
-        st.stop() # Stop execution if the file is not found
-    except Exception as e:
-        st.error(f"An error occurred while loading the data: {e}")
-        st.stop()
-
-# Assign the DataFrame from session state for use in the rest of the script
-df = st.session_state['netflix_df'].copy() # Use .copy() to avoid SettingWithCopyWarning
-
-# --- Normalize column names ---
-df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
-
-# --- derive year column (prefer release_year else parse date_added) ---
-if 'release_year' in df.columns:
-    df['year'] = df['release_year']
-elif 'date_added' in df.columns:
-    # Ensure date_added is treated as a string before using .str.split()
-    df['date_added'] = df['date_added'].astype(str)
-    # The original code used pd.to_datetime, which is better:
-    df['year'] = pd.to_datetime(df['date_added'], errors='coerce').dt.year
-else:
-    df['year'] = None
-
-# --- Prepare options for widgets ---
-show_types = sorted(df['type'].dropna().unique().tolist())
-ratings = sorted(df['rating'].dropna().unique().tolist())
-# Safely convert years to int and filter out NaNs (which can happen if date_added or release_year is missing/invalid)
-years = sorted([int(y) for y in df['year'].dropna().unique().tolist() if not pd.isna(y)], reverse=True)
-titles = sorted(df['title'].dropna().unique().tolist())
-directors = sorted(df['director'].dropna().unique().tolist())
-
-# split cast into individual names
-cast_names = []
-if 'cast' in df.columns:
-    cast_series = df['cast'].dropna().astype(str).str.split(',')
-    cast_flat = [actor.strip() for sub in cast_series for actor in sub if isinstance(sub, list)]
-    cast_names = sorted(set([c for c in cast_flat if c]))
+# --- Load the shared catalog Safely ---
+try:
+    catalog = get_catalog()
+except FileNotFoundError as e:
+    st.error(f"Error: {e}. Please ensure the dataset is available.")
+    st.stop() # Stop execution if the file is not found
+except Exception as e:
+    st.error(f"An error occurred while loading the data: {e}")
+    st.stop()
+
+# Bitmaps / posting lists are built once per dataset version and shared by all sessions
+@cache_per_version()
+def load_filter_engine(catalog):
+    return FilterEngine(catalog)
+
+engine = load_filter_engine(catalog)
+
+# --- Options for widgets: built once per dataset version ("All" first, newest year first) ---
+@cache_per_version()
+def load_filter_options(catalog):
+    engine = load_filter_engine(catalog)
+    return {
+        "type": ["All"] + engine.options('type'),
+        "rating": ["All"] + engine.options('rating'),
+        "year": ["All"] + [str(y) for y in sorted(engine.options('year'), reverse=True)],
+        "director": ["All"] + engine.options('director'),
+    }
+
+options = load_filter_options(catalog)
+
+# Title and cast lists are too large to ship to the browser; they are searched server-side
+title_search = engine.typeahead('title')
+cast_search = engine.typeahead('cast')
 
 # --- WIDGET KEYS & session_state defaults ---
 WIDGET_KEYS = {
@@ -136,20 +128,27 @@ WIDGET_KEYS = {
     "director": "filter_director",
 }
 
+# Search boxes feeding the Title / Cast Member selectboxes
+QUERY_KEYS = {
+    "title": "filter_title_query",
+    "cast": "filter_cast_query",
+}
+
 for k in WIDGET_KEYS.values():
     if k not in st.session_state:
         st.session_state[k] = "All"
+for k in QUERY_KEYS.values():
+    if k not in st.session_state:
+        st.session_state[k] = ""
 
 # --- Reset callback (safe: modifies session_state via callback) ---
 def reset_filters():
     for k in WIDGET_KEYS.values():
         st.session_state[k] = "All"
+    for k in QUERY_KEYS.values():
+        st.session_state[k] = ""
     # st.experimental_rerun() is often not needed just for changing state values
 
-# --- Layout: two rows, six columns (2 columns per filter) ---
-st.markdown("###  Search & Filter")
-col1, col2, col3 = st.columns(3)
-
 # Helper: safe index chooser (returns 0 if not found)
 def safe_index(options, desired):
     try:
@@ -157,97 +156,95 @@ def safe_index(options, desired):
     except Exception:
         return 0
 
-# making the selectbox to filter
-with col1:
-    opts = ["All"] + show_types
-    st.selectbox(
-        "Type",
-        options=opts,
-        index=safe_index(opts, st.session_state[WIDGET_KEYS["type"]]),
-        key=WIDGET_KEYS["type"],
-    )
-with col2:
-    opts = ["All"] + ratings
-    st.selectbox(
-        "Rating",
-        options=opts,
-        index=safe_index(opts, st.session_state[WIDGET_KEYS["rating"]]),
-        key=WIDGET_KEYS["rating"],
-    )
-with col3:
-    year_opts = ["All"] + [str(y) for y in years]
-    st.selectbox(
-        "Year Released",
-        options=year_opts,
-        index=safe_index(year_opts, st.session_state[WIDGET_KEYS["year"]]),
-        key=WIDGET_KEYS["year"],
-    )
-
-#making selectbox (second row)     
-col1b, col2b, col3b= st.columns(3)
-
-with col1b:
-    opts = ["All"] + titles
-    st.selectbox(
-        "Title",
-        options=opts,
-        index=safe_index(opts, st.session_state[WIDGET_KEYS["title"]]),
-        key=WIDGET_KEYS["title"],
-    )
-with col2b:
-    opts = ["All"] + cast_names
-    st.selectbox(
-        "Cast Member",
-        options=opts,
-        index=safe_index(opts, st.session_state[WIDGET_KEYS["cast"]]),
-        key=WIDGET_KEYS["cast"],
-    )
-with col3b:
-    opts = ["All"] + directors
-    st.selectbox(
-        "Director",
-        options=opts,
-        index=safe_index(opts, st.session_state[WIDGET_KEYS["director"]]),
-        key=WIDGET_KEYS["director"],
-    )
-
-# --- Reset button (safe) ---
-st.markdown("---")
-st.button(" Reset Filters", on_click=reset_filters)
-
-# --- Apply filters to dataframe ---
-filtered_df = df.copy()
-
-if st.session_state[WIDGET_KEYS["type"]] != "All":
-    filtered_df = filtered_df[filtered_df['type'] == st.session_state[WIDGET_KEYS["type"]]]
-
-if st.session_state[WIDGET_KEYS["rating"]] != "All":
-    filtered_df = filtered_df[filtered_df['rating'] == st.session_state[WIDGET_KEYS["rating"]]]
-
-if st.session_state[WIDGET_KEYS["year"]] != "All":
-    try:
-        yval = int(st.session_state[WIDGET_KEYS["year"]])
-        # Filter where 'year' is not null AND equals the selected year
-        filtered_df = filtered_df[filtered_df['year'].notna() & (filtered_df['year'] == yval)]
-    except Exception:
-        pass
-
-if st.session_state[WIDGET_KEYS["title"]] != "All":
-    # Use exact match for titles when a specific title is selected for clarity
-    filtered_df = filtered_df[filtered_df['title'].astype(str) == st.session_state[WIDGET_KEYS["title"]]]
-
-
-if st.session_state[WIDGET_KEYS["cast"]] != "All" and 'cast' in filtered_df.columns:
-    # Ensure 'cast' is string type and handle NaNs before using str.contains
-    cast_filter = st.session_state[WIDGET_KEYS["cast"]]
-    filtered_df = filtered_df[filtered_df['cast'].astype(str).str.contains(cast_filter, case=False, na=False)]
+# Helper: "All" + top server-side matches for the typed query (keeps the current pick)
+def search_options(index, field):
+    selected = st.session_state[WIDGET_KEYS[field]]
+    query = st.session_state[QUERY_KEYS[field]]
+    return ["All"] + suggestions(index, query, selected=None if selected == "All" else selected)
 
-
-if st.session_state[WIDGET_KEYS["director"]] != "All":
-    # Ensure 'director' is string type and handle NaNs before using str.contains
-    director_filter = st.session_state[WIDGET_KEYS["director"]]
-    filtered_df = filtered_df[filtered_df['director'].astype(str).str.contains(director_filter, case=False, na=False)]
-
-# --- Show results ---
-st.markdown(f"###  Results ({len(filtered_df)} records)")
-st.dataframe(filtered_df.reset_index(drop=True))
\ No newline at end of file
+# --- Layout: two rows, six columns (2 columns per filter) ---
+# The panel and its results run as one fragment: a filter change reruns only
+# this part of the page, and paging the grid reruns only the grid's own fragment.
+@st.fragment
+def content_explorer():
+    st.markdown("###  Search & Filter")
+    col1, col2, col3 = st.columns(3)
+
+    # making the selectbox to filter
+    with col1:
+        opts = options["type"]
+        st.selectbox(
+            "Type",
+            options=opts,
+            index=safe_index(opts, st.session_state[WIDGET_KEYS["type"]]),
+            key=WIDGET_KEYS["type"],
+        )
+    with col2:
+        opts = options["rating"]
+        st.selectbox(
+            "Rating",
+            options=opts,
+            index=safe_index(opts, st.session_state[WIDGET_KEYS["rating"]]),
+            key=WIDGET_KEYS["rating"],
+        )
+    with col3:
+        year_opts = options["year"]
+        st.selectbox(
+            "Year Released",
+            options=year_opts,
+            index=safe_index(year_opts, st.session_state[WIDGET_KEYS["year"]]),
+            key=WIDGET_KEYS["year"],
+        )
+
+    #making selectbox (second row)     
+    col1b, col2b, col3b= st.columns(3)
+
+    with col1b:
+        st.text_input("Search Title", key=QUERY_KEYS["title"], placeholder="Type to search titles")
+        opts = search_options(title_search, "title")
+        st.selectbox(
+            "Title",
+            options=opts,
+            index=safe_index(opts, st.session_state[WIDGET_KEYS["title"]]),
+            key=WIDGET_KEYS["title"],
+        )
+    with col2b:
+        st.text_input("Search Cast", key=QUERY_KEYS["cast"], placeholder="Type to search cast members")
+        opts = search_options(cast_search, "cast")
+        st.selectbox(
+            "Cast Member",
+            options=opts,
+            index=safe_index(opts, st.session_state[WIDGET_KEYS["cast"]]),
+            key=WIDGET_KEYS["cast"],
+        )
+    with col3b:
+        opts = options["director"]
+        st.selectbox(
+            "Director",
+            options=opts,
+            index=safe_index(opts, st.session_state[WIDGET_KEYS["director"]]),
+            key=WIDGET_KEYS["director"],
+        )
+
+    # --- Reset button (safe) ---
+    st.markdown("---")
+    st.button(" Reset Filters", on_click=reset_filters)
+
+    # --- Apply filters: bitmap AND + posting-list intersection (row ids only) ---
+    filters = {
+        field: st.session_state[key]
+        for field, key in WIDGET_KEYS.items()
+        if st.session_state[key] != "All"
+    }
+    if 'year' in filters:
+        try:
+            filters['year'] = int(filters['year'])
+        except (TypeError, ValueError):
+            del filters['year']
+
+    row_ids = engine.query(filters)
+    # --- Show results (one page of projected columns; description on row selection) ---
+    st.markdown(f"###  Results ({len(row_ids)} records)")
+    render_result_grid(catalog.titles, row_ids, key="explorer", query=tuple(sorted(filters.items())))
+
+content_explorer()
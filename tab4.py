@@ -1,7 +1,16 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 
+from analytics import cooccurrence_counts
+from artifact_store import persisted_stage
+from catalog import get_catalog
+from cube import get_cube
+from dataset_cache import cache_per_version
+from figure_cache import cached_figure
+from sections import lazy_section
+
 # -----------------------------
 # 🎨 CUSTOM DARK METAMORPHIC GLOW CSS (APPLIED)
 # -----------------------------
@@ -99,8 +108,9 @@ def end_card():
 # Load dataframe
 # -----------------------------
 try:
-    # Assuming 'netflix_df' is loaded into session_state elsewhere
-    df = st.session_state['netflix_df'].copy()
+    # Shared read-only catalog (no per-session copy)
+    catalog = get_catalog()
+    df = catalog.titles
 except:
     st.error("DataFrame not found.")
     st.stop()
@@ -126,35 +136,16 @@ def update_fig_style(fig, title):
 # -----------------------------
 # PREPROCESSING
 # -----------------------------
-# Preprocessing for all sections
-country_counts = (
-    df['country'].dropna().str.split(',').explode().str.strip().value_counts().reset_index()
-)
-country_counts.columns = ['country', 'count']
-
-df_geo = df.copy().dropna(subset=['country', 'type'])
-df_geo = df_geo.assign(country=df_geo['country'].str.split(', ')).explode('country')
-df_geo['country'] = df_geo['country'].str.strip()
-
-movies_df = df_geo[df_geo['type'] == 'Movie']
-tv_df = df_geo[df_geo['type'] == 'TV Show']
+# Preprocessing for all sections (country counts are rolled up from the pre-aggregated cube,
+# country/genre explodes come from the catalog bridges)
+cube = get_cube(catalog)
 
-movies_pct = movies_df['country'].value_counts(normalize=True).reset_index()
-movies_pct.columns = ['country', 'percentage']
-movies_pct['percentage'] *= 100
-
-tv_pct = tv_df['country'].value_counts(normalize=True).reset_index()
-tv_pct.columns = ['country', 'percentage']
-tv_pct['percentage'] *= 100
-
-df_pre_origin = df.copy()
-df_pre_origin['country'] = df_pre_origin['country'].astype(str)
-df_pre_origin = df_pre_origin[df_pre_origin['country'].notna()]
-df_pre_origin = df_pre_origin[df_pre_origin['country'].str.lower() != 'unknown']
-
-df_pre_origin['date_added'] = pd.to_datetime(df_pre_origin['date_added'], errors='coerce')
-df_pre_origin['year_added'] = df_pre_origin['date_added'].dt.year
-df_pre_origin['primary_country'] = df_pre_origin['country'].str.split(',').str[0].str.strip()
+def type_country_pct(content_type):
+    """Share (%) of `content_type` titles per country; a title counts once per listed country."""
+    counts = cube.rollup('country', {'type': content_type}).sort_values(ascending=False)
+    pct = (counts * 100 / counts.sum()).reset_index()
+    pct.columns = ['country', 'percentage']
+    return pct
 
 def get_origin(country):
     if country == 'United States':
@@ -164,8 +155,23 @@ def get_origin(country):
     else:
         return 'International'
 
-df_pre_origin['content_origin'] = df_pre_origin['primary_country'].apply(get_origin)
-df_pre_origin = df_pre_origin.dropna(subset=['content_origin'])
+# Origin columns are derived once per dataset version, persisted across restarts and shared read-only
+@cache_per_version()
+@persisted_stage('tab4.origin_frame')
+def derive_origin_frame(catalog):
+    titles = catalog.titles
+    df_pre_origin = titles[titles['country'].astype(str).str.lower() != 'unknown']
+    df_pre_origin = df_pre_origin.assign(
+        country=df_pre_origin['country'].astype(str),
+        year_added=catalog.dates['year_added'],
+    )
+    df_pre_origin['primary_country'] = catalog.primary('country', rows=df_pre_origin)
+
+    df_pre_origin['content_origin'] = df_pre_origin['primary_country'].apply(get_origin)
+    return df_pre_origin.dropna(subset=['content_origin'])
+
+# Sections below are lazy: only the first is open by default, and a closed
+# section derives and draws nothing.
 
 # -----------------------------
 # GRAPH 2 & 3 SECTION: Movies vs TV Shows Scatter Map
@@ -179,35 +185,46 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-glow_card("Content Distribution by Movies vs TV Shows")
+def render_type_maps():
+    glow_card("Content Distribution by Movies vs TV Shows")
 
-col_a, col_b = st.columns(2)
+    col_a, col_b = st.columns(2)
 
-with col_a:
-    fig2 = px.scatter_geo(
-        movies_pct, locations="country", locationmode="country names", size="percentage",
-        hover_name="country", hover_data={"percentage": ":.2f"}, projection="natural earth",
-        color_discrete_sequence=["#FF4C4C"] # Lighter red for visibility
-    )
-    fig2 = update_fig_style(fig2, 'Movies: % of Titles per Country')
+    with col_a:
+        def plot_movie_share_map():
+            fig2 = px.scatter_geo(
+                type_country_pct('Movie'), locations="country", locationmode="country names", size="percentage",
+                hover_name="country", hover_data={"percentage": ":.2f"}, projection="natural earth",
+                color_discrete_sequence=["#FF4C4C"] # Lighter red for visibility
+            )
+            fig2 = update_fig_style(fig2, 'Movies: % of Titles per Country')
+            return fig2
 
-    # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
-    st.plotly_chart(fig2, use_container_width=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+        fig2 = cached_figure(catalog.version, 'tab4.movie_share_map', plot_movie_share_map)
 
-with col_b:
-    fig3 = px.scatter_geo(
-        tv_pct, locations="country", locationmode="country names", size="percentage",
-        hover_name="country", hover_data={"percentage": ":.2f"}, projection="natural earth",
-        color_discrete_sequence=["#B22222"] # Darker red/maroon for TV
-    )
-    fig3 = update_fig_style(fig3, 'TV Shows: % of Titles per Country')
+        # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
+        st.plotly_chart(fig2, use_container_width=True)
+        st.markdown("</div>", unsafe_allow_html=True)
 
-    # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
-    st.plotly_chart(fig3, use_container_width=True)
-    st.markdown("</div>", unsafe_allow_html=True)
+    with col_b:
+        def plot_tv_share_map():
+            fig3 = px.scatter_geo(
+                type_country_pct('TV Show'), locations="country", locationmode="country names", size="percentage",
+                hover_name="country", hover_data={"percentage": ":.2f"}, projection="natural earth",
+                color_discrete_sequence=["#B22222"] # Darker red/maroon for TV
+            )
+            fig3 = update_fig_style(fig3, 'TV Shows: % of Titles per Country')
+            return fig3
 
-end_card()
+        fig3 = cached_figure(catalog.version, 'tab4.tv_share_map', plot_tv_share_map)
+
+        # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
+        st.plotly_chart(fig3, use_container_width=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    end_card()
+
+lazy_section("Show charts", "tab4_type_maps", render_type_maps, expanded=True)
 
 st.markdown("---")
 
@@ -223,72 +240,79 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-glow_card("Movies vs TV Shows + Top Genre (Country-wise)")
-
-df = df.dropna(subset=['country', 'type', 'listed_in'])
-df = df.assign(country=df['country'].str.split(', ')).explode('country')
-df['country'] = df['country'].str.strip()
-
-df["genre_list"] = df["listed_in"].str.split(",").apply(lambda x: [i.strip() for i in x])
-genre_dummies = df["genre_list"].explode().str.get_dummies().groupby(level=0).sum()
-df = df.join(genre_dummies)
-genre_cols = genre_dummies.columns.tolist()
-
-movies_df = df[df['type'] == "Movie"]
-tv_df = df[df['type'] == "TV Show"]
-
-movies_pct = movies_df['country'].value_counts(normalize=True).reset_index()
-movies_pct.columns = ['country', 'percentage']
-movies_pct['percentage'] *= 100
+# Top genre per country is derived once per dataset version (only on a figure cache miss)
+@cache_per_version()
+def derive_top_genre_frames(catalog):
+    titles = catalog.titles
+    keep = titles[['country', 'type', 'listed_in']].notna().all(axis=1).to_numpy()
+
+    # (title, country, genre) triples straight from the bridges' category codes
+    pairs = catalog.bridge('country').merge(catalog.bridge('genre'), on='title_id')
+    pairs = pairs[keep[pairs['title_id'].to_numpy()]]
+    types = titles['type'].to_numpy()[pairs['title_id'].to_numpy()]
+    countries = pairs['country'].cat.categories
+    genres = pairs['genre'].cat.categories
+    genre_cols = genres[np.unique(pairs['genre'].cat.codes)].tolist()
+
+    def get_top_genre(content_type):
+        # country x genre title counts via one np.bincount; argmax keeps the
+        # alphabetically first genre on ties, like idxmax over dummy columns.
+        # A title counts once per (country, genre) it lists; the original
+        # dummy-matrix version weighted it by its number of countries.
+        selected = types == content_type
+        counts = cooccurrence_counts(
+            pairs['country'].cat.codes.to_numpy()[selected],
+            pairs['genre'].cat.codes.to_numpy()[selected],
+            len(countries), len(genres),
+        )
+        listed = counts.sum(axis=1) > 0
+        return pd.DataFrame({
+            "country": countries[listed].astype(str),
+            "top_genre": genres[counts[listed].argmax(axis=1)].astype(str),
+        })
+
+    movies_final = type_country_pct('Movie').merge(get_top_genre('Movie'), on="country", how="left")
+    tv_final = type_country_pct('TV Show').merge(get_top_genre('TV Show'), on="country", how="left")
+
+    # Use a set of diverse colors for genres
+    color_map = {
+        g: px.colors.qualitative.Bold[i % len(px.colors.qualitative.Bold)]
+        for i, g in enumerate(genre_cols)
+    }
+    return {'Movie': movies_final, 'TV Show': tv_final}, color_map
+
+def plot_top_genre_map(content_type):
+    finals, color_map = derive_top_genre_frames(catalog)
+    fig = px.scatter_geo(
+        finals[content_type], locations="country", locationmode="country names", size="percentage",
+        color="top_genre", hover_name="country", projection="natural earth",
+        color_discrete_map=color_map
+    )
+    title = "Movies: % of Titles & Top Genre" if content_type == 'Movie' else "TV Shows: % of Titles & Top Genre"
+    return update_fig_style(fig, title)
 
-tv_pct = tv_df['country'].value_counts(normalize=True).reset_index()
-tv_pct.columns = ['country', 'percentage']
-tv_pct['percentage'] *= 100
+def render_top_genre_maps():
+    glow_card("Movies vs TV Shows + Top Genre (Country-wise)")
 
-def get_top_genre(df_):
-    grouped = df_.groupby("country")[genre_cols].sum()
-    top = grouped.idxmax(axis=1)
-    return top.reset_index().rename(columns={0: "top_genre"})
+    col1, col2 = st.columns(2)
 
-movies_top = get_top_genre(movies_df)
-tv_top = get_top_genre(tv_df)
+    with col1:
+        fig_movies = cached_figure(catalog.version, 'tab4.top_genre_map', plot_top_genre_map, content_type='Movie')
 
-movies_final = movies_pct.merge(movies_top, on="country", how="left")
-tv_final = tv_pct.merge(tv_top, on="country", how="left")
+        # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
+        st.plotly_chart(fig_movies, use_container_width=True)
+        st.markdown("</div>", unsafe_allow_html=True)
 
-# Use a set of diverse colors for genres
-color_map = {
-    g: px.colors.qualitative.Bold[i % len(px.colors.qualitative.Bold)]
-    for i, g in enumerate(genre_cols)
-}
+    with col2:
+        fig_tv = cached_figure(catalog.version, 'tab4.top_genre_map', plot_top_genre_map, content_type='TV Show')
 
-col1, col2 = st.columns(2)
+        # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
+        st.plotly_chart(fig_tv, use_container_width=True)
+        st.markdown("</div>", unsafe_allow_html=True)
 
-with col1:
-    fig_movies = px.scatter_geo(
-        movies_final, locations="country", locationmode="country names", size="percentage",
-        color="top_genre", hover_name="country", projection="natural earth",
-        color_discrete_map=color_map
-    )
-    fig_movies = update_fig_style(fig_movies, "Movies: % of Titles & Top Genre")
+    end_card()
 
-    # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
-    st.plotly_chart(fig_movies, use_container_width=True)
-    st.markdown("</div>", unsafe_allow_html=True)
-
-with col2:
-    fig_tv = px.scatter_geo(
-        tv_final, locations="country", locationmode="country names", size="percentage",
-        color="top_genre", hover_name="country", projection="natural earth",
-        color_discrete_map=color_map
-    )
-    fig_tv = update_fig_style(fig_tv, "TV Shows: % of Titles & Top Genre")
-
-    # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
-    st.plotly_chart(fig_tv, use_container_width=True)
-    st.markdown("</div>", unsafe_allow_html=True)
-
-end_card()
+lazy_section("Show charts", "tab4_top_genre_maps", render_top_genre_maps, expanded=False)
 
 st.markdown("---")
 
@@ -304,75 +328,95 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-glow_card("International vs Domestic Analysis")
+def render_origin_analysis():
+    glow_card("International vs Domestic Analysis")
 
-# TOP 10 COUNTRIES
-countries_g4 = (
-    df_pre_origin['country']
-    .str.split(',').explode().str.strip()
-)
-countries_g4 = countries_g4[countries_g4.str.lower() != 'united states']
-top_countries_g4 = countries_g4.value_counts().head(10).reset_index()
-top_countries_g4.columns = ['Country', 'Count']
+    # TOP 10 COUNTRIES
+    def plot_top_international():
+        df_pre_origin = derive_origin_frame(catalog)
+        countries_g4 = catalog.exploded('country', rows=df_pre_origin)['country']
+        countries_g4 = countries_g4[countries_g4.str.lower() != 'united states']
+        top_countries_g4 = countries_g4.value_counts().head(10).reset_index()
+        top_countries_g4.columns = ['Country', 'Count']
 
-fig4 = px.bar(
-    top_countries_g4, x='Country', y='Count', text='Count',
-    color_discrete_sequence=['#FF4C4C']
-)
-fig4 = update_fig_style(fig4, 'Top 10 International Countries')
+        fig4 = px.bar(
+            top_countries_g4, x='Country', y='Count', text='Count',
+            color_discrete_sequence=['#FF4C4C']
+        )
+        fig4 = update_fig_style(fig4, 'Top 10 International Countries')
+        return fig4
 
-# st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
-st.plotly_chart(fig4, use_container_width=True)
-st.markdown("</div>", unsafe_allow_html=True)
+    fig4 = cached_figure(catalog.version, 'tab4.top_international', plot_top_international)
 
-# COUNTRY VS CONTENT TYPE
-df_non_us_type = df_pre_origin[~df_pre_origin['primary_country'].str.contains('United States', case=False, na=False)]
-top_countries_g5 = df_non_us_type['primary_country'].value_counts().head(10).index
-df_top_g5 = df_non_us_type[df_non_us_type['primary_country'].isin(top_countries_g5)]
+    # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
+    st.plotly_chart(fig4, use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
 
-country_type = df_top_g5.groupby(['primary_country', 'type']).size().reset_index(name='count')
+    # COUNTRY VS CONTENT TYPE
+    def plot_country_type():
+        df_pre_origin = derive_origin_frame(catalog)
+        df_non_us_type = df_pre_origin[~df_pre_origin['primary_country'].str.contains('United States', case=False, na=False)]
+        top_countries_g5 = df_non_us_type['primary_country'].value_counts().head(10).index
+        df_top_g5 = df_non_us_type[df_non_us_type['primary_country'].isin(top_countries_g5)]
 
-fig5 = px.bar(
-    country_type, y='primary_country', x='count', color='type',
-    orientation='h', color_discrete_sequence=['#FF4C4C', '#B22222']
-)
-fig5 = update_fig_style(fig5, 'Country vs Content Type')
+        country_type = df_top_g5.groupby(['primary_country', 'type'], observed=True).size().reset_index(name='count')
 
-# st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
-st.plotly_chart(fig5, use_container_width=True)
-st.markdown("</div>", unsafe_allow_html=True)
+        fig5 = px.bar(
+            country_type, y='primary_country', x='count', color='type',
+            orientation='h', color_discrete_sequence=['#FF4C4C', '#B22222']
+        )
+        fig5 = update_fig_style(fig5, 'Country vs Content Type')
+        return fig5
 
+    fig5 = cached_figure(catalog.version, 'tab4.country_type', plot_country_type)
 
-# GROWTH TREND
-yearly = df_pre_origin.groupby(['year_added', 'content_origin']).size().reset_index(name='count')
+    # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
+    st.plotly_chart(fig5, use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
 
-fig6 = px.line(
-    yearly, x='year_added', y='count', color='content_origin',
-    markers=True, color_discrete_sequence=['#FF4C4C', '#B22222']
-)
-fig6 = update_fig_style(fig6, 'Growth Over Time (Domestic vs International)')
 
-# st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
-st.plotly_chart(fig6, use_container_width=True)
-st.markdown("</div>", unsafe_allow_html=True)
+    # GROWTH TREND
+    def plot_origin_growth():
+        df_pre_origin = derive_origin_frame(catalog)
+        yearly = df_pre_origin.groupby(['year_added', 'content_origin']).size().reset_index(name='count')
 
+        fig6 = px.line(
+            yearly, x='year_added', y='count', color='content_origin',
+            markers=True, color_discrete_sequence=['#FF4C4C', '#B22222']
+        )
+        fig6 = update_fig_style(fig6, 'Growth Over Time (Domestic vs International)')
+        return fig6
 
-# RATING DISTRIBUTION
-rating_counts = df_pre_origin.groupby(['rating', 'content_origin']).size().reset_index(name='count')
-rating_order = df_pre_origin['rating'].value_counts().index.tolist()
+    fig6 = cached_figure(catalog.version, 'tab4.origin_growth', plot_origin_growth)
+
+    # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
+    st.plotly_chart(fig6, use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
 
-fig7 = px.bar(
-    rating_counts, y='rating', x='count', color='content_origin',
-    orientation='h', color_discrete_sequence=['#FF4C4C', '#B22222'],
-    category_orders={'rating': rating_order}
-)
-fig7 = update_fig_style(fig7, 'Rating Distribution by Origin')
 
-# st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
-st.plotly_chart(fig7, use_container_width=True)
-st.markdown("</div>", unsafe_allow_html=True)
+    # RATING DISTRIBUTION
+    def plot_rating_origin():
+        df_pre_origin = derive_origin_frame(catalog)
+        rating_counts = df_pre_origin.groupby(['rating', 'content_origin'], observed=True).size().reset_index(name='count')
+        rating_order = df_pre_origin['rating'].value_counts().index.tolist()
 
-end_card()
+        fig7 = px.bar(
+            rating_counts, y='rating', x='count', color='content_origin',
+            orientation='h', color_discrete_sequence=['#FF4C4C', '#B22222'],
+            category_orders={'rating': rating_order}
+        )
+        fig7 = update_fig_style(fig7, 'Rating Distribution by Origin')
+        return fig7
+
+    fig7 = cached_figure(catalog.version, 'tab4.rating_origin', plot_rating_origin)
+
+    # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
+    st.plotly_chart(fig7, use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    end_card()
+
+lazy_section("Show charts", "tab4_origin_analysis", render_origin_analysis, expanded=False)
 
 st.markdown("---")
 
@@ -380,46 +424,53 @@ st.markdown("---")
 # -----------------------------
 # PIE CHART SECTION: Country Contribution
 # -----------------------------
-glow_card("Country Contribution — Pie Chart")
-
-all_count1 = df['country'].value_counts()
-
-if len(all_count1) > 10:
-    mcpctrs1 = all_count1.head(10).copy()
-    mcpctrs1['Others'] = all_count1.iloc[10:].sum()
-else:
-    mcpctrs1 = all_count1.copy()
-
-df_pie = mcpctrs1.reset_index()
-df_pie.columns = ['Country', 'Count']
-
-# Adjusted color palette for dark theme
-new_colors_red_brown = [
-    '#E50914', '#B20710', '#800000', '#A52A2A', '#CD853F',
-    '#D2B48C', '#F5DEB3', '#DEB887', '#BC8F8F', '#A9A9A9', '#696969'
-]
-colors_for_plot = new_colors_red_brown[:len(df_pie)]
-
-fig = px.pie(
-    df_pie, values='Count', names='Country',
-    color_discrete_sequence=colors_for_plot,
-    height=700, hole=0.3
-)
-fig.update_traces(
-    textinfo='percent+label',
-    marker=dict(line=dict(color='#000000', width=2)), # Darker line for contrast
-    textfont=dict(color="#FFFFFF"),
-)
+def render_country_pie():
+    glow_card("Country Contribution — Pie Chart")
+
+    def plot_country_pie():
+        all_count1 = cube.rollup('country', {'type': pd.notna}).sort_values(ascending=False)
+
+        if len(all_count1) > 10:
+            mcpctrs1 = all_count1.head(10).copy()
+            mcpctrs1['Others'] = all_count1.iloc[10:].sum()
+        else:
+            mcpctrs1 = all_count1.copy()
+
+        df_pie = mcpctrs1.reset_index()
+        df_pie.columns = ['Country', 'Count']
+
+        # Adjusted color palette for dark theme
+        new_colors_red_brown = [
+            '#E50914', '#B20710', '#800000', '#A52A2A', '#CD853F',
+            '#D2B48C', '#F5DEB3', '#DEB887', '#BC8F8F', '#A9A9A9', '#696969'
+        ]
+        colors_for_plot = new_colors_red_brown[:len(df_pie)]
+
+        fig = px.pie(
+            df_pie, values='Count', names='Country',
+            color_discrete_sequence=colors_for_plot,
+            height=700, hole=0.3
+        )
+        fig.update_traces(
+            textinfo='percent+label',
+            marker=dict(line=dict(color='#000000', width=2)), # Darker line for contrast
+            textfont=dict(color="#FFFFFF"),
+        )
+
+        # Apply Dark Theme
+        fig = update_fig_style(fig, 'Top Country Contribution')
+        fig.update_layout(
+            margin=dict(t=50, b=50), # Adjust margins for the pie chart
+            showlegend=True
+        )
+        return fig
+
+    fig = cached_figure(catalog.version, 'tab4.country_pie', plot_country_pie)
 
-# Apply Dark Theme
-fig = update_fig_style(fig, 'Top Country Contribution')
-fig.update_layout(
-    margin=dict(t=50, b=50), # Adjust margins for the pie chart
-    showlegend=True
-)
+    # st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
+    st.plotly_chart(fig, use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
 
-# st.markdown("<div class='chart-wrap'>", unsafe_allow_html=True)
-st.plotly_chart(fig, use_container_width=True)
-st.markdown("</div>", unsafe_allow_html=True)
+    end_card()
 
-end_card()
+lazy_section("Show country contribution", "tab4_country_pie", render_country_pie, expanded=False)
@@ -4,6 +4,12 @@ import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
 
+from analytics import mode_per_group
+from artifact_store import persisted_stage
+from catalog import get_catalog
+from cube import get_cube
+from dataset_cache import cache_per_version
+
 # ---------------------------------------------------------
 # PAGE CONFIG
 # ---------------------------------------------------------
@@ -96,30 +102,39 @@ def end_card():
 # LOAD DATA
 # ---------------------------------------------------------
 try:
-    df = st.session_state['netflix_df'].copy()
-except KeyError:
-    st.error("Error: Netflix DataFrame not found in session state.")
+    # Shared read-only catalog (no per-session copy)
+    catalog = get_catalog()
+    df = catalog.titles
+    cube = get_cube(catalog)
+except Exception as e:
+    st.error(f"Error: Netflix catalog could not be loaded: {e}")
     st.stop()
 
 # ---------------------------------------------------------
 # SECTION 1 — TOP GENRE PER COUNTRY
 # ---------------------------------------------------------
-df1 = df[['title', 'listed_in', 'country', 'rating']].dropna(subset=['listed_in', 'country', 'rating']).copy()
-df1['country'] = df1['country'].str.split(', ')
-df1['listed_in'] = df1['listed_in'].str.split(', ')
-df1 = df1.explode('country').explode('listed_in')
-df1.rename(columns={'listed_in': 'Genre', 'country': 'Country'}, inplace=True)
+# Top genre per country with its dominant rating: derived once per dataset
+# version and persisted across restarts
+@cache_per_version()
+@persisted_stage('tab5.insight_table')
+def derive_insight_table(catalog):
+    df1 = catalog.exploded(['country', 'genre'], rows=catalog.titles.dropna(subset=['rating']), columns=['title', 'rating'])
+    df1.rename(columns={'genre': 'Genre', 'country': 'Country'}, inplace=True)
+
+    # Country x genre title counts are rolled up from the pre-aggregated cube
+    genre_counts = get_cube(catalog).rollup(['country', 'genre'], {'rating': pd.notna}).reset_index(name='Count')
+    genre_counts.rename(columns={'country': 'Country', 'genre': 'Genre'}, inplace=True)
+    top_genre = genre_counts.loc[genre_counts.groupby('Country')['Count'].idxmax()]
 
-genre_counts = df1.groupby(['Country', 'Genre']).size().reset_index(name='Count')
-top_genre = genre_counts.loc[genre_counts.groupby('Country')['Count'].idxmax()]
+    # Dominant rating per country x genre and the share of titles carrying it
+    rating_mode = mode_per_group(df1, ['Country', 'Genre'], 'rating')
 
-rating_mode = df1.groupby(['Country', 'Genre'])['rating'].agg(
-    lambda x: x.mode()[0] if not x.mode().empty else None
-).reset_index()
+    insight_df = pd.merge(top_genre, rating_mode, on=['Country', 'Genre'], how='left')
+    insight_df = insight_df.sort_values(by='Count', ascending=False).reset_index(drop=True)
+    insight_df['Country_Genre'] = insight_df['Country'] + ' - ' + insight_df['Genre']
+    return insight_df
 
-insight_df = pd.merge(top_genre, rating_mode, on=['Country', 'Genre'], how='left')
-insight_df = insight_df.sort_values(by='Count', ascending=False).reset_index(drop=True)
-insight_df['Country_Genre'] = insight_df['Country'] + ' - ' + insight_df['Genre']
+insight_df = derive_insight_table(catalog)
 
 top15 = insight_df.sort_values('Count', ascending=False).head(15)
 red_palette = ['#FFB3B3', '#FF6666', '#B22222', '#800000']
@@ -129,7 +144,9 @@ fig1 = px.bar(
     x='Country_Genre',
     y='Count',
     color='rating',
-
+    text=top15['mode_share'].map('{:.0%}'.format),
+    hover_data={'mode_share': ':.0%'},
+    labels={'mode_share': 'Share with this rating'},
     color_discrete_sequence=red_palette
 )
 
@@ -155,26 +172,15 @@ end_card()
 TOP_N = 5
 RED_SHADES = ['#B00610', '#E50914', '#FF6F61', '#FF8A80', '#FFB3B3']
 
-df2 = df.copy()
-df2['date_added'] = df2['date_added'].astype(str).str.strip()
-df2['date_added'] = pd.to_datetime(df2['date_added'], errors='coerce')
-df2 = df2[df2['date_added'].notna()]
-
-df2['year_added'] = df2['date_added'].dt.year.astype(int)
-df_exp = df2.dropna(subset=['listed_in']).copy()
-df_exp['listed_in'] = df_exp['listed_in'].astype(str)
-df_exp = df_exp.assign(genre=df_exp['listed_in'].str.split(',')).explode('genre')
-df_exp['genre'] = df_exp['genre'].str.strip()
-
-id_col = next((c for c in ['show_id','id','title_id','title'] if c in df_exp.columns), df_exp.columns[0])
-genre_totals = df_exp.groupby('genre')[id_col].nunique().sort_values(ascending=False)
+# Distinct titles per genre / year added (titles with a date_added only), from the cube
+added = {'year_added': pd.notna}
+genre_totals = cube.rollup('genre', added).sort_values(ascending=False)
 top_genres = genre_totals.head(TOP_N).index.tolist()
 
 year_genre = (
-    df_exp[df_exp['genre'].isin(top_genres)]
-    .groupby(['year_added','genre'])[id_col]
-    .nunique()
+    cube.rollup(['year_added', 'genre'], {**added, 'genre': top_genres})
     .reset_index(name='count')
+    .astype({'year_added': int})
 )
 
 min_year = int(year_genre['year_added'].min())
@@ -217,9 +223,7 @@ end_card()
 # ---------------------------------------------------------
 # SECTION 3 — GENRE VS RATING SPREAD (BOXPLOT)
 # ---------------------------------------------------------
-genre_df = df.copy()
-genre_df['listed_in'] = genre_df['listed_in'].fillna('Unknown')
-genre_df = genre_df.assign(genre=genre_df['listed_in'].str.split(', ')).explode('genre')
+genre_df = catalog.exploded('genre', columns=['rating'])
 
 fig3 = px.box(
     genre_df,
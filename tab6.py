@@ -4,7 +4,13 @@ import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
 import os
-import kagglehub
+
+import imdb_enrichment
+from analytics import top_k_per_group
+from artifact_store import persisted_stage
+from catalog import get_catalog
+from dataset_cache import cache_per_version
+from typeahead import suggestions
 
 # --- 1. Configuration (MUST be the first command) ---
 # Set theme to 'dark' for Streamlit native dark elements (sidebar, widgets)
@@ -38,47 +44,32 @@ CUSTOM_PLOT3_COLORS = [
 # 2. Data Loading and Preparation Functions
 # ------------------------------------------------------------
 
-@st.cache_data
 def load_main_data():
-    """Downloads and loads the Netflix dataset (used for search and plots A, B, C)."""
+    """Loads the shared Netflix catalog (used for search and plots A, B, C)."""
     try:
-        data_path = "netflix_titles.csv"
-        # Using KaggleHub download logic as the primary way to ensure data availability.
-        with st.spinner("Downloading Netflix dataset via KaggleHub..."):
-            path = kagglehub.dataset_download("shivamb/netflix-shows")
-            data_path = f"{path}/netflix_titles.csv"
-            
-        df = pd.read_csv(data_path)
-        # Normalize columns for consistency
-        df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
-        return df
+        # The shared resolver only consults KaggleHub when no valid local copy exists.
+        with st.spinner("Loading Netflix dataset..."):
+            return get_catalog()
     except Exception as e:
         st.error(f"Could not load main dataset: {e}")
-        return pd.DataFrame()
+        return None
 
-@st.cache_data
-def prepare_genre_cast_data(df):
-    """Performs genre and cast explosion and cleaning for Plots A, B, C."""
-    if df.empty:
+@cache_per_version()
+@persisted_stage('tab6.genre_cast')
+def prepare_genre_cast_data(catalog):
+    """Joins the genre and cast bridges for Plots A, B, C (shared read-only per dataset version)."""
+    if catalog.titles.empty:
         return pd.DataFrame(), pd.DataFrame()
 
-    df_exploded = df.copy()
-    df_exploded['country'] = df_exploded['country'].fillna('Missing') 
-    # Explode genres
-    df_exploded['genre'] = df_exploded['listed_in'].str.split(',')
-    df_exploded['genre'] = df_exploded['genre'].apply(lambda x: [i.strip() for i in x])
-    df_exploded = df_exploded.explode('genre', ignore_index=True)
-    
-    # Explode cast
-    df1 = df_exploded.copy()
-    # Handles comma space and comma splits
-    df1['cast'] = df1['cast'].astype(str).str.split(',\\s*') 
-    df1 = df1.explode('cast')
-    
-    df1 = df1[df1['cast'].notna()]
-    df1 = df1[df1['cast'].str.strip() != '']
-    
-    return df_exploded, df1
+    # Titles by genre, keeping the raw country string per title
+    df_exploded = catalog.exploded('genre', columns=['country'])
+    df_exploded['country'] = df_exploded['country'].fillna('Missing')
+
+    # Titles by genre x cast member
+    df1 = catalog.exploded(['genre', 'cast'], columns=['country'])
+    df1['country'] = df1['country'].fillna('Missing')
+
+    return df_exploded.reset_index(drop=True), df1
 
 # ------------------------------------------------------------
 # 3. Plotting Functions (A, B, C) - Updated for Dark Theme
@@ -99,68 +90,48 @@ def update_plot_layout_dark(fig, title_text):
     )
     return fig
 
-def plot_top_cast_by_genre(df1):
-    """Plot A: Top 5 Cast in Top 5 Genres Grouped Bar Chart."""
-    if df1.empty or 'genre' not in df1.columns or 'cast' not in df1.columns:
-        return go.Figure().add_annotation(text="Insufficient data for Plot A", showarrow=False, font={'color': DARK_TEXT})
-        
-    top5_genres = df1['genre'].value_counts().nlargest(5).index
-    if top5_genres.empty:
-        return go.Figure().add_annotation(text="Insufficient genre data for Plot A", showarrow=False, font={'color': DARK_TEXT})
+# Group columns the talent plots can break cast members down by
+CAST_GROUPS = {'genre': 'Genres', 'country': 'Content-Producing Countries'}
 
-    top5_cast_genre = (
-        df1[df1['genre'].isin(top5_genres)]
-        .groupby(['genre', 'cast']).size()
-        .reset_index(name='count')
-    )
-    if top5_cast_genre.empty:
-        return go.Figure().add_annotation(text="Insufficient cast/genre data for Plot A", showarrow=False, font={'color': DARK_TEXT})
-        
-    top5_cast_genre = top5_cast_genre.groupby('genre').apply(lambda x: x.nlargest(5, 'count')).reset_index(drop=True)
-    
-    fig = px.bar(
-        top5_cast_genre, 
-        x='cast', 
-        y='count', 
-        color='genre', 
-        barmode='group',
-        color_discrete_sequence=NETFLIX_REDS,
-        labels={'count': 'Count of Titles', 'cast': 'Cast Member'},
-    )
-    return update_plot_layout_dark(fig, "Top 5 Cast Members in Each of the Top 5 Genres")
+def plot_top_cast_by_group(df1, group_col, k, n_groups=5, plot_name='A'):
+    """Top `k` cast members in each of the `n_groups` largest `group_col` groups, as a grouped bar chart."""
+    if df1.empty or group_col not in df1.columns or 'cast' not in df1.columns:
+        return go.Figure().add_annotation(text=f"Insufficient data for Plot {plot_name}", showarrow=False, font={'color': DARK_TEXT})
 
-def plot_top_cast_by_country(df1):
-    """Plot B: Top 3 Cast in Top 5 Countries Grouped Bar Chart."""
-    if df1.empty or 'country' not in df1.columns or 'cast' not in df1.columns:
-        return go.Figure().add_annotation(text="Insufficient data for Plot B", showarrow=False, font={'color': DARK_TEXT})
-        
-    df1['country'] = df1['country'].fillna('Missing')
-    top5_countries = df1['country'].value_counts().nlargest(5).index
-    
-    if top5_countries.empty:
-        return go.Figure().add_annotation(text="Insufficient country data for Plot B", showarrow=False, font={'color': DARK_TEXT})
+    # country is already filled with 'Missing' by prepare_genre_cast_data
+    top_groups = df1[group_col].value_counts().nlargest(n_groups).index
+    if top_groups.empty:
+        return go.Figure().add_annotation(text=f"Insufficient {group_col} data for Plot {plot_name}", showarrow=False, font={'color': DARK_TEXT})
 
-    top3_cast_country = (
-        df1[df1['country'].isin(top5_countries)]
-        .groupby(['country', 'cast']).size()
+    cast_counts = (
+        df1[df1[group_col].isin(top_groups)]
+        .groupby([group_col, 'cast']).size()
         .reset_index(name='count')
     )
-    
-    if top3_cast_country.empty:
-        return go.Figure().add_annotation(text="Insufficient cast/country data for Plot B", showarrow=False, font={'color': DARK_TEXT})
-        
-    top3_cast_country = top3_cast_country.groupby('country').apply(lambda x: x.nlargest(3, 'count')).reset_index(drop=True)
+    if cast_counts.empty:
+        return go.Figure().add_annotation(text=f"Insufficient cast/{group_col} data for Plot {plot_name}", showarrow=False, font={'color': DARK_TEXT})
+
+    # One sort + cumcount instead of groupby.apply(nlargest) per group
+    top_cast = top_k_per_group(cast_counts, group_col, k)
 
     fig = px.bar(
-        top3_cast_country, 
+        top_cast, 
         x='cast', 
         y='count', 
-        color='country', 
+        color=group_col, 
         barmode='group',
         color_discrete_sequence=NETFLIX_REDS,
         labels={'count': 'Count of Titles', 'cast': 'Cast Member'},
     )
-    return update_plot_layout_dark(fig, "Top 3 Cast Members in Each of the Top 5 Content-Producing Countries")
+    return update_plot_layout_dark(fig, f"Top {k} Cast Members in Each of the Top {n_groups} {CAST_GROUPS[group_col]}")
+
+def plot_top_cast_by_genre(df1, k=5):
+    """Plot A: Top 5 Cast in Top 5 Genres Grouped Bar Chart."""
+    return plot_top_cast_by_group(df1, 'genre', k, plot_name='A')
+
+def plot_top_cast_by_country(df1, k=3):
+    """Plot B: Top 3 Cast in Top 5 Countries Grouped Bar Chart."""
+    return plot_top_cast_by_group(df1, 'country', k, plot_name='B')
 
 def plot_genre_distribution_by_country(df_exploded):
     """Plot C: Genre Distribution by Top 4 Countries Stacked Horizontal Bar Chart (Custom Colors)."""
@@ -206,57 +177,33 @@ def plot_genre_distribution_by_country(df_exploded):
 # ------------------------------------------------------------
 # 4. Data Loading and Processing for IMDb Plots (D, E)
 # ------------------------------------------------------------
-# (IMDb data loading logic remains the same for functionality, 
-# but warnings are updated for clarity in a dark theme context.)
+# The IMDb file is exploded by cast member once per file fingerprint and the
+# aggregates persisted next to it (see imdb_enrichment); reruns only stat it.
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_imdb_enrichment(csv_path, size, mtime_ns):
+    """Plot D / E aggregates, shared read-only per version (size, mtime) of the IMDb file."""
+    return imdb_enrichment.load_enrichment(csv_path)
 
-csv_file_path = 'Plotting data/netflix_titles_with_imdb_ratings_2.csv' 
-df_imdb = None
+csv_file_path = imdb_enrichment.IMDB_CSV_PATH
 filtered_data = pd.DataFrame() # Data for Plot D
 country_counts = pd.DataFrame() # Data for Plot E
 imdb_data_available = False
 
 try:
     if os.path.exists(csv_file_path):
-        df_imdb = pd.read_csv(csv_file_path)
-        df_imdb.columns = df_imdb.columns.str.strip().str.lower().str.replace(' ', '_')
+        stat = os.stat(csv_file_path)
+        enrichment = load_imdb_enrichment(csv_file_path, stat.st_size, stat.st_mtime_ns)
+        filtered_data = imdb_enrichment.top_rated_actors(enrichment['actor_country_rating'])
+        country_counts = imdb_enrichment.top_countries_by_actors(enrichment['country_actor_counts'])
         imdb_data_available = True
-    
-    if df_imdb is not None and not df_imdb.empty:
-        if all(col in df_imdb.columns for col in ['cast', 'averagerating', 'country']):
-            # --- Processing for Plot D and E ---
-            df_imdb['cast'] = df_imdb['cast'].astype(str).str.split(', ')
-            df1_imdb = df_imdb.explode('cast')
-            netflix_imdb = df1_imdb.dropna(subset=['cast', 'averagerating', 'country'])
-
-            # Plot D Logic
-            cast_country_rating = (netflix_imdb.assign(actor=netflix_imdb['cast'].str.split(',')).explode('actor').dropna(subset=['actor']))
-            cast_country_rating['actor'] = cast_country_rating['actor'].str.strip()
-            actor_country_rating = (cast_country_rating.groupby(['country', 'actor'], as_index=False)['averagerating'].mean())
-            top_actors = (actor_country_rating.groupby('actor')['averagerating'].mean().nlargest(15).index)
-            filtered_data = actor_country_rating[actor_country_rating['actor'].isin(top_actors)]
-            
-            # Plot E Logic
-            df_imdb_dist = df_imdb.copy()
-            df_imdb_dist['cast'] = df_imdb_dist['cast'].astype(str).str.split(', ')
-            df1_dist = df_imdb_dist.explode('cast')
-            netflix_dist = df1_dist.dropna(subset=['country', 'cast'])
-            df_dist = (netflix_dist.assign(actor=netflix_dist['cast'].str.split(',')).explode('actor').dropna(subset=['actor']))
-            df_dist['actor'] = df_dist['actor'].str.strip()
-            df_unique = df_dist.drop_duplicates(subset=['country', 'actor'])
-            top_countries = df_unique['country'].value_counts().nlargest(5).index
-            df_top = df_unique[df_unique['country'].isin(top_countries)]
-            country_counts = df_top['country'].value_counts().reset_index()
-            country_counts.columns = ['country', 'unique_actor_count']
-        else:
-            st.warning("IMDb file loaded, but missing one or more required columns ('cast', 'averagerating', 'country') for Plots D and E.")
-            imdb_data_available = False
-            
-    if not imdb_data_available and not os.path.exists(csv_file_path):
+    else:
         st.warning(f"⚠️ **IMDb Data Missing:** The file '{csv_file_path}' was not found. Plots D and E cannot be generated. Please place the required data file in the specified path.")
-        
+
+except imdb_enrichment.MissingColumnsError:
+    st.warning("IMDb file loaded, but missing one or more required columns ('cast', 'averagerating', 'country') for Plots D and E.")
 except Exception as e:
     st.error(f"An error occurred during IMDb file processing: {e}")
-    imdb_data_available = False
 
 
 # ------------------------------------------------------------
@@ -264,13 +211,14 @@ except Exception as e:
 # ------------------------------------------------------------
 
 # Load the main dataset for the Search & Plots A, B, C
-df = load_main_data()
-if df.empty:
+catalog = load_main_data()
+if catalog is None or catalog.titles.empty:
     st.error("Cannot proceed without the main Netflix dataset.")
     st.stop()
+df = catalog.titles
 
 # Prepare data for Plots A, B, C
-df_exploded, df1 = prepare_genre_cast_data(df)
+df_exploded, df1 = prepare_genre_cast_data(catalog)
 
 
 # --- Apply Custom CSS (Updated for Dark Theme) ---
@@ -384,15 +332,16 @@ st.markdown("<h1 style='text-align: center; color: red;'>Director and Cast Conte
 st.header(" Director Search")
 
 
-directors = df['director'].dropna().unique()
-directors = sorted(directors)
+# Individual director names from the catalog's inverted index (already sorted)
+directors = catalog.index('director').names.tolist()
 
 col_s1, col_sc, col_s2 = st.columns([1, 4, 1])
 with col_sc:
     # Streamlit's selectbox will automatically adapt to the dark theme setting
     selected_director = st.selectbox("Select a Director", directors, key="dir_select")
 
-filtered_df = df[df['director'] == selected_director]
+# Includes co-directed titles via the director posting list
+filtered_df = catalog.titles_for('director', selected_director)
 
 # Display simple metric for director's work
 
@@ -411,20 +360,15 @@ st.markdown("---")
 
 st.header(" Cast Search")
 
-actors = (
-    df['cast']
-    .dropna()
-    .apply(lambda x: [a.strip() for a in x.split(',')])
-    .explode()
-    .unique()
-)
-cast = sorted(actors)
-
 col_s3, col_sc2, col_s4 = st.columns([1, 4, 1])
 with col_sc2:
+    # Server-side search: only the top matches for the typed query are sent as options
+    cast_query = st.text_input("Search Cast", key="cast_query", placeholder="Type to search cast members")
+    cast = suggestions(catalog.typeahead('cast'), cast_query, selected=st.session_state.get("cast_select"))
     selected_cast = st.selectbox("Select a Cast Member", cast, key="cast_select")
 
-filtered_cast_df = df[df['cast'].fillna("").str.contains(selected_cast, case=False, na=False)]
+# Exact-name posting list lookup instead of a substring scan over every row
+filtered_cast_df = catalog.titles_for('cast', selected_cast)
 
 # Display simple metric for cast member's work
 
@@ -444,23 +388,22 @@ st.markdown("<h1 style='text-align: center; color: red;'>Content and Talent Anal
 # --- ROW 1: Plots A and B ---
 col_A, col_B = st.columns(2)
 
-# Plot A: Top 5 Cast by Top 5 Genres
-with col_A:
-    
-    if not df1.empty and 'genre' in df1.columns:
-        fig1 = plot_top_cast_by_genre(df1)
-        st.plotly_chart(fig1, use_container_width=True)
-    else:
-        st.info("Data unavailable to generate Plot A.")
+# Plot A (default: Top 5 Cast by Top 5 Genres) and Plot B (default: Top 3 Cast by
+# Top 5 Content-Producing Countries); group column and k are chosen in the UI
+for col, plot_name, default_group, default_k in [(col_A, 'A', 'genre', 5), (col_B, 'B', 'country', 3)]:
+    with col:
+        ctl_group, ctl_k = st.columns(2)
+        group_col = ctl_group.selectbox(
+            "Group by", list(CAST_GROUPS), index=list(CAST_GROUPS).index(default_group),
+            format_func=lambda g: g.title(), key=f"plot_{plot_name}_group",
+        )
+        k = ctl_k.slider("Cast members per group", 1, 10, default_k, key=f"plot_{plot_name}_k")
 
-# Plot B: Top 3 Cast by Top 5 Content-Producing Countries
-with col_B:
-    
-    if not df1.empty and 'country' in df1.columns:
-        fig2 = plot_top_cast_by_country(df1)
-        st.plotly_chart(fig2, use_container_width=True)
-    else:
-        st.info("Data unavailable to generate Plot B.")
+        if not df1.empty and group_col in df1.columns:
+            fig = plot_top_cast_by_group(df1, group_col, k, plot_name=plot_name)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info(f"Data unavailable to generate Plot {plot_name}.")
 
 st.markdown("---")
 
@@ -0,0 +1,75 @@
+import numpy as np
+
+# ------------------------------------------------------------
+# Server-side typeahead over a sorted name array
+# ------------------------------------------------------------
+# Instead of shipping every title / cast name to the browser as selectbox
+# options, pages keep a search box and only send the top matches.
+# Prefix matches come from a binary search over the casefolded, sorted keys;
+# infix matches come from str.find over one newline-joined haystack and stop
+# as soon as enough matches are found.
+
+DEFAULT_LIMIT = 50
+_MAX_CHAR = "\U0010ffff"
+
+
+class TypeaheadIndex:
+    """Ranked prefix/infix search over a fixed set of names."""
+
+    def __init__(self, names, weights=None):
+        names = np.asarray(list(names), dtype=object)
+        keys = np.array([str(n).casefold().replace("\n", " ") for n in names], dtype=object)
+
+        order = np.argsort(keys, kind="stable")
+        self.names = names[order]
+        self.keys = keys[order]
+
+        lengths = np.fromiter((len(k) + 1 for k in self.keys), dtype=np.int64, count=len(self.keys))
+        self._starts = np.concatenate(([0], np.cumsum(lengths)))[:-1]
+        self._haystack = "\n".join(self.keys)
+
+        # Suggestions for an empty query: most frequent names first
+        if weights is None:
+            self._popular = np.arange(len(self.names))
+        else:
+            weights = np.asarray(weights)[order]
+            self._popular = np.argsort(-weights, kind="stable")
+
+    @classmethod
+    def from_postings(cls, index):
+        """Typeahead over a PostingIndex, ranking empty-query suggestions by title count."""
+        return cls(index.names, weights=np.diff(index.offsets))
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """Up to `limit` names matching `query`: prefix matches first, then infix matches."""
+        q = (query or "").strip().casefold()
+        if not q:
+            return self.names[self._popular[:limit]].tolist()
+
+        lo = np.searchsorted(self.keys, q, side="left")
+        hi = np.searchsorted(self.keys, q + _MAX_CHAR, side="left")
+        matches = list(range(lo, min(hi, lo + limit)))
+
+        seen = set(matches)
+        pos = self._haystack.find(q)
+        while pos != -1 and len(matches) < limit:
+            i = int(np.searchsorted(self._starts, pos, side="right")) - 1
+            if i not in seen:
+                matches.append(i)
+                seen.add(i)
+            # Continue from the next key; one hit per name is enough
+            next_start = self._starts[i + 1] if i + 1 < len(self._starts) else len(self._haystack)
+            pos = self._haystack.find(q, next_start)
+
+        return self.names[matches].tolist()
+
+
+def suggestions(index, query, selected=None, limit=DEFAULT_LIMIT):
+    """Options for a search-backed selectbox, always keeping the current selection available."""
+    matches = index.search(query, limit)
+    if selected is not None and selected not in matches:
+        matches = [selected] + matches
+    return matches
@@ -0,0 +1,136 @@
+import os
+import sys
+import time
+
+import pandas as pd
+import streamlit as st
+
+import imdb_enrichment
+import resolver
+from catalog import INDEXED_BRIDGES, get_catalog
+
+# ------------------------------------------------------------
+# Cache warm-up
+# ------------------------------------------------------------
+# `python warmup.py serve [streamlit options]` warms the process and then
+# starts the app server in that same process, so the first visitor after a
+# deploy finds everything built:
+#
+#   data stages  dataset resolution, catalog (published to the artifact
+#                store), aggregate cube, search indexes, IMDb enrichment
+#   page stages  every page executed once headlessly with all of its lazy
+#                sections open, which fills the in-memory caches the pages
+#                read (figures, per-version derivations, filter engines)
+#
+# Those page caches live in process memory, so a warm-up run in another
+# process (`python warmup.py [pages]`, which only checks that every stage
+# succeeds and times it) leaves the server cold apart from the published
+# catalog. The server is only started, and its health endpoint only answers,
+# once the warm-up has finished.
+#
+# Each stage is timed and reported; the command exits non-zero when a stage
+# fails, so a deploy can gate readiness on it. A server started any other way
+# (`streamlit run app.py`) still runs the data stages once (warm_process,
+# called from app.py), but builds the page caches on first use.
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+PAGES = ["tab1.py", "tab2.py", "tab3.py", "tab4.py", "tab5.py", "tab6.py", "tab7.py"]
+
+# Seconds a single page may take to run headlessly
+PAGE_TIMEOUT = 300
+
+
+def _imdb_enrichment():
+    if os.path.exists(imdb_enrichment.IMDB_CSV_PATH):
+        imdb_enrichment.load_enrichment(imdb_enrichment.IMDB_CSV_PATH)
+
+
+def data_stages():
+    """(name, callable) pairs of the process-wide data stages, in dependency order."""
+    return [
+        ("catalog", get_catalog),
+        ("aggregate cube", lambda: get_catalog().cube()),
+        ("search indexes", lambda: [get_catalog().typeahead(name) for name in INDEXED_BRIDGES]),
+        ("imdb enrichment", _imdb_enrichment),
+    ]
+
+
+def _run_page(page):
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(os.path.join(APP_DIR, page), default_timeout=PAGE_TIMEOUT).run()
+    # Open every lazy section so its derivations run too
+    closed = [toggle for toggle in app.toggle if not toggle.value]
+    if closed:
+        for toggle in closed:
+            toggle.set_value(True)
+        app.run()
+    if app.exception:
+        raise RuntimeError(f"{page}: {app.exception[0].value}")
+    # Pages catch their own failures and render them with st.error; a
+    # st.warning (e.g. tab6's missing IMDb file) is not a failure
+    if app.error:
+        raise RuntimeError(f"{page}: " + " / ".join(error.value for error in app.error))
+
+
+def page_stages(pages=PAGES):
+    """(name, callable) pairs running each page once headlessly."""
+    return [(f"page {page}", lambda page=page: _run_page(page)) for page in pages]
+
+
+def run_stages(stages, report=None):
+    """Runs `stages` in order and returns {name: seconds}. Stops at the first failure."""
+    timings = {}
+    for name, stage in stages:
+        start = time.perf_counter()
+        stage()
+        timings[name] = time.perf_counter() - start
+        if report:
+            report(name, timings[name])
+    return timings
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _warm_version(version):
+    return run_stages(data_stages())
+
+
+def warm_process():
+    """Runs the data stages once per process and dataset version; returns their timings."""
+    return _warm_version(resolver.resolve()["sha256"])
+
+
+def main(pages=PAGES):
+    def report(name, seconds):
+        print(f"{name:<24} {seconds:8.2f} s", flush=True)
+
+    start = time.perf_counter()
+    try:
+        run_stages([("resolve dataset", resolver.resolve)] + data_stages() + page_stages(pages), report)
+    except Exception as e:
+        print(f"warm-up failed: {e}", file=sys.stderr)
+        return 1
+    print(f"{'total':<24} {time.perf_counter() - start:8.2f} s")
+    return 0
+
+
+def serve(streamlit_args=()):
+    """Warms this process, then runs the app server in it with `streamlit_args`."""
+    status = main(PAGES)
+    if status:
+        return status
+    # app.py's warm_process finds this version already warmed
+    warm_process()
+
+    from streamlit.web import cli
+    return cli.main(["run", os.path.join(APP_DIR, "app.py"), *streamlit_args], prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    # Pages resolve data files relative to the app directory
+    os.chdir(APP_DIR)
+    # Same process-wide pandas semantics as app.py, which the pages do not run through here
+    pd.set_option("mode.copy_on_write", True)
+    if sys.argv[1:2] == ["serve"]:
+        sys.exit(serve(sys.argv[2:]))
+    sys.exit(main(sys.argv[1:] or PAGES))